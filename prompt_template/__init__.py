@@ -1,5 +1,8 @@
 """Prompt Template - A tool for managing and rendering LLM prompts."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 # Analysis imports
 from .analyzer import TemplateAnalyzer, TokenCounter
 from .models import (
@@ -12,9 +15,6 @@ from .models import (
     VariableConfig,
     VariableType,
 )
-
-# Quality scoring imports
-from .quality import DimensionScore, QualityDimension, QualityReport, QualityScorer
 from .registry import TemplateInfo, TemplateRegistry
 from .renderer import TemplateRenderer
 
@@ -29,6 +29,23 @@ from .template import (
 )
 from .validator import TemplateValidator, ValidationResult
 
+# Quality scoring is imported on first access (see __getattr__), so users
+# that only load and render templates skip compiling its pattern tables
+if TYPE_CHECKING:
+    from .quality import (
+        DimensionScore,
+        QualityDimension,
+        QualityReport,
+        QualityScorer,
+    )
+
+_LAZY_IMPORTS = {
+    "DimensionScore": ".quality",
+    "QualityDimension": ".quality",
+    "QualityReport": ".quality",
+    "QualityScorer": ".quality",
+}
+
 __version__ = "0.1.0"
 
 __all__ = [
@@ -67,3 +84,24 @@ __all__ = [
     "QualityDimension",
     "DimensionScore",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        The requested object
+
+    Raises:
+        AttributeError: If the name is not exported by this package
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
@@ -9,13 +9,18 @@ import click
 import yaml
 from rich.console import Console
 from rich.panel import Panel
-from rich.syntax import Syntax
 from rich.table import Table
 
 from .formatters import get_formatter
 from .registry import TemplateRegistry
 from .template import Template, TemplateError
 
+# Prefer the LibYAML-backed dumper; fall back to pure Python if unavailable
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+
 console = Console()
 
 
@@ -204,6 +209,9 @@ def _show_search_paths(registry: TemplateRegistry) -> None:
 @click.option("--preview", is_flag=True, help="Show template preview with placeholders")
 def show_template(name: str, raw: bool, preview: bool) -> None:
     """Show details of a template."""
+    # Only `show` highlights source; rich.syntax pulls in pygments
+    from rich.syntax import Syntax
+
     registry = get_registry()
 
     try:
@@ -212,8 +220,12 @@ def show_template(name: str, raw: bool, preview: bool) -> None:
         handle_template_error(e)
 
     if raw:
-        content = template.config.model_dump(by_alias=True, exclude_none=True)
-        yaml_content = yaml.dump(content, default_flow_style=False, sort_keys=False)
+        content = template.config.model_dump(
+            mode="json", by_alias=True, exclude_none=True
+        )
+        yaml_content = yaml.dump(
+            content, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False
+        )
         syntax = Syntax(yaml_content, "yaml", theme="monokai", line_numbers=True)
         console.print(syntax)
         return
@@ -561,7 +573,11 @@ REVIEW:""",
         if not filepath.exists():
             with open(filepath, "w") as f:
                 yaml.dump(
-                    example["content"], f, default_flow_style=False, sort_keys=False
+                    example["content"],
+                    f,
+                    Dumper=_SafeDumper,
+                    default_flow_style=False,
+                    sort_keys=False,
                 )
             console.print(f"[green]Created:[/green] {filepath}")
         else:
@@ -633,7 +649,9 @@ def new_template(name: str, output: str | None) -> None:
 
     # Save template
     with open(output_path, "w") as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(
+            config, f, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False
+        )
 
     console.print(f"\n[green]Template saved to:[/green] {output_path}")
 
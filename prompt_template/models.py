@@ -133,6 +133,22 @@ class TemplateConfig(BaseModel):
                 return var
         return None
 
+    def get_variable_names(self) -> set[str]:
+        """Get the set of defined variable names."""
+        return {v.name for v in self.variables}
+
+    def get_variables_by_name(self) -> dict[str, VariableConfig]:
+        """Get variable configurations indexed by name.
+
+        Build this once for repeated lookups instead of calling
+        get_variable() in a loop. If a name is defined more than once,
+        the first definition wins, matching get_variable().
+        """
+        index: dict[str, VariableConfig] = {}
+        for var in self.variables:
+            index.setdefault(var.name, var)
+        return index
+
     def get_declared_required_variables(self) -> list[VariableConfig]:
         """Get all variables marked as required (regardless of defaults).
 
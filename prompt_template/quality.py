@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import re
-from dataclasses import dataclass, field
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from itertools import repeat
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from .analyzer import TokenCounter
@@ -13,6 +17,21 @@ if TYPE_CHECKING:
     from .models import TemplateConfig
 
 
+def _grade_table(thresholds: list[tuple[int, str]]) -> tuple[str, ...]:
+    """Map every score from 0 to 100 to its grade.
+
+    Args:
+        thresholds: (minimum score, grade) pairs, highest threshold first
+
+    Returns:
+        Tuple indexed by score
+    """
+    return tuple(
+        next((grade for minimum, grade in thresholds if score >= minimum), "F")
+        for score in range(101)
+    )
+
+
 class QualityDimension(str, Enum):
     """Quality dimensions for scoring."""
 
@@ -23,18 +42,18 @@ class QualityDimension(str, Enum):
     STRUCTURE = "structure"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DimensionScore:
     """Score for a single quality dimension."""
 
     dimension: QualityDimension
     score: int  # 0-100
     weight: float  # Weight in overall calculation
-    details: list[str] = field(default_factory=list)
-    suggestions: list[str] = field(default_factory=list)
+    details: tuple[str, ...] = ()
+    suggestions: tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QualityReport:
     """Complete quality assessment report."""
 
@@ -43,7 +62,7 @@ class QualityReport:
     grade: str  # A, B, C, D, F
     dimensions: dict[QualityDimension, DimensionScore] = field(default_factory=dict)
     summary: str = ""
-    top_suggestions: list[str] = field(default_factory=list)
+    top_suggestions: tuple[str, ...] = ()
 
     @property
     def is_production_ready(self) -> bool:
@@ -95,9 +114,54 @@ class QualityScorer:
         (0, "F"),
     ]
 
-    def __init__(self) -> None:
-        """Initialize the quality scorer."""
-        self.token_counter = TokenCounter()
+    # Grade for every clamped score 0-100, derived from GRADE_THRESHOLDS
+    GRADE_BY_SCORE: ClassVar[tuple[str, ...]] = _grade_table(GRADE_THRESHOLDS)
+
+    # Summary text for each grade
+    GRADE_SUMMARIES: ClassVar[dict[str, str]] = {
+        "A": "Excellent quality template, ready for production use.",
+        "B": "Good quality template with minor improvements possible.",
+        "C": "Acceptable template, but several areas need attention.",
+        "D": "Below average quality, significant improvements recommended.",
+        "F": "Poor quality template, requires substantial revision.",
+    }
+
+    # Clarity signals, authored lowercase and matched against lowercased content
+    ROLE_RE: ClassVar[re.Pattern[str]] = re.compile(r"you are|act as|<role>|<persona>")
+    TASK_RE: ClassVar[re.Pattern[str]] = re.compile(
+        r"your (?:task|goal|job) is|please|<task>|<instructions>"
+    )
+    OUTPUT_RE: ClassVar[re.Pattern[str]] = re.compile(
+        r"<output_format>|respond in|format your"
+    )
+    AMBIGUOUS_RE: ClassVar[re.Pattern[str]] = re.compile(
+        r"\b(?:maybe|perhaps|might want to|could potentially)\b"
+    )
+
+    # Consistency, efficiency, and structure signals
+    CAMEL_CASE_RE: ClassVar[re.Pattern[str]] = re.compile(r"[a-z][A-Z]")
+    PLACEHOLDER_RE: ClassVar[re.Pattern[str]] = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+    XML_TAG_RE: ClassVar[re.Pattern[str]] = re.compile(r"<[a-z_]+>")
+    MD_HEADER_RE: ClassVar[re.Pattern[str]] = re.compile(r"^#{1,3}\s", re.MULTILINE)
+    SECTION_MARKER_RE: ClassVar[re.Pattern[str]] = re.compile(r"^===", re.MULTILINE)
+    NESTING_TAG_RE: ClassVar[re.Pattern[str]] = re.compile(
+        r"\{%\s*(if|for|endif|endfor)\s*"
+    )
+
+    # Maximum number of reports kept for repeated scoring of the same config
+    CACHE_SIZE: ClassVar[int] = 128
+
+    def __init__(self, use_tokenizer: bool = False) -> None:
+        """Initialize the quality scorer.
+
+        Args:
+            use_tokenizer: Count tokens with tiktoken when it is installed.
+                By default the character-based estimate is used, which is
+                accurate enough for the efficiency thresholds and much
+                cheaper on long templates.
+        """
+        self.token_counter = TokenCounter(use_tiktoken=use_tokenizer)
+        self._report_cache: OrderedDict[str, QualityReport] = OrderedDict()
 
     def score(
         self,
@@ -106,6 +170,11 @@ class QualityScorer:
     ) -> QualityReport:
         """Calculate quality score for a template.
 
+        Reports are cached by the content of the config and sample values,
+        so scoring an identical template again skips the analysis. Each
+        call gets its own dimensions dict, so callers cannot alter the
+        cached report.
+
         Args:
             config: Template configuration
             sample_values: Optional sample values for analysis
@@ -113,37 +182,73 @@ class QualityScorer:
         Returns:
             QualityReport with scores and suggestions
         """
+        key = self._cache_key(config, sample_values)
+        report = self._report_cache.get(key)
+        if report is None:
+            report = self._score_uncached(config, sample_values)
+            self._report_cache[key] = report
+            if len(self._report_cache) > self.CACHE_SIZE:
+                self._report_cache.popitem(last=False)
+        else:
+            self._report_cache.move_to_end(key)
+        return replace(report, dimensions=dict(report.dimensions))
+
+    def cache_clear(self) -> None:
+        """Discard all cached quality reports."""
+        self._report_cache.clear()
+
+    @staticmethod
+    def _cache_key(config: TemplateConfig, sample_values: dict[str, Any] | None) -> str:
+        """Build a stable digest of the inputs that determine a report."""
+        payload = json.dumps(
+            [config.model_dump(mode="json"), sample_values],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _score_uncached(
+        self,
+        config: TemplateConfig,
+        sample_values: dict[str, Any] | None,
+    ) -> QualityReport:
+        """Run every dimension scorer and assemble the report."""
         # Calculate individual dimension scores
         dimensions: dict[QualityDimension, DimensionScore] = {}
 
-        dimensions[QualityDimension.CLARITY] = self._score_clarity(config)
+        # Join and lowercase the prompt text once for all dimensions
+        all_content = (
+            (config.system_prompt or "")
+            + (config.user_prompt or "")
+            + (config.template or "")
+        )
+        content_lower = all_content.lower()
+
+        dimensions[QualityDimension.CLARITY] = self._score_clarity(
+            config, content_lower
+        )
         dimensions[QualityDimension.CONSISTENCY] = self._score_consistency(config)
-        dimensions[QualityDimension.COMPLETENESS] = self._score_completeness(config)
+        dimensions[QualityDimension.COMPLETENESS] = self._score_completeness(
+            config, all_content
+        )
         dimensions[QualityDimension.EFFICIENCY] = self._score_efficiency(
-            config, sample_values
+            config, all_content, content_lower, sample_values
+        )
+        dimensions[QualityDimension.STRUCTURE] = self._score_structure(
+            config, all_content, content_lower
         )
-        dimensions[QualityDimension.STRUCTURE] = self._score_structure(config)
 
         # Calculate weighted overall score
         overall_score = sum(
             score.score * score.weight for score in dimensions.values()
         )
-        overall_score = int(overall_score)
+        overall_score = self._clamp(int(overall_score))
 
         # Determine grade
-        grade = "F"
-        for threshold, g in self.GRADE_THRESHOLDS:
-            if overall_score >= threshold:
-                grade = g
-                break
-
-        # Collect top suggestions
-        all_suggestions: list[str] = []
-        for dim_score in dimensions.values():
-            all_suggestions.extend(dim_score.suggestions)
+        grade = self.GRADE_BY_SCORE[overall_score]
 
-        # Deduplicate and prioritize
-        top_suggestions = list(dict.fromkeys(all_suggestions))[:5]
+        # Collect top suggestions (deduplicated, stop once we have 5)
+        top_suggestions = self._collect_top_suggestions(dimensions)
 
         # Generate summary
         summary = self._generate_summary(overall_score, grade)
@@ -154,26 +259,45 @@ class QualityScorer:
             grade=grade,
             dimensions=dimensions,
             summary=summary,
-            top_suggestions=top_suggestions,
+            top_suggestions=tuple(top_suggestions),
         )
 
-    def _score_clarity(self, config: TemplateConfig) -> DimensionScore:
-        """Score clarity of the template."""
+    @staticmethod
+    def _clamp(value: int) -> int:
+        """Clamp a score to the 0-100 range."""
+        return 0 if value < 0 else 100 if value > 100 else value
+
+    @staticmethod
+    def _collect_top_suggestions(
+        dimensions: dict[QualityDimension, DimensionScore], limit: int = 5
+    ) -> list[str]:
+        """Collect unique suggestions in dimension order, up to limit."""
+        seen: set[str] = set()
+        top_suggestions: list[str] = []
+        for dim_score in dimensions.values():
+            for suggestion in dim_score.suggestions:
+                if suggestion in seen:
+                    continue
+                seen.add(suggestion)
+                top_suggestions.append(suggestion)
+                if len(top_suggestions) == limit:
+                    return top_suggestions
+        return top_suggestions
+
+    def _score_clarity(
+        self, config: TemplateConfig, content_lower: str
+    ) -> DimensionScore:
+        """Score clarity of the template.
+
+        All clarity patterns are authored lowercase and matched against
+        the lowercased prompt text.
+        """
         score = 100
         details: list[str] = []
         suggestions: list[str] = []
 
-        all_content = (
-            (config.system_prompt or "")
-            + (config.user_prompt or "")
-            + (config.template or "")
-        )
-
         # Check for clear role definition
-        role_patterns = [r"you are", r"act as", r"<role>", r"<persona>"]
-        has_role = any(
-            re.search(p, all_content, re.IGNORECASE) for p in role_patterns
-        )
+        has_role = self.ROLE_RE.search(content_lower) is not None
         if has_role:
             details.append("Clear role definition found")
         else:
@@ -182,15 +306,7 @@ class QualityScorer:
             suggestions.append("Add a clear role definition (e.g., 'You are a...')")
 
         # Check for clear task/instructions
-        task_patterns = [
-            r"your (task|goal|job) is",
-            r"please",
-            r"<task>",
-            r"<instructions>",
-        ]
-        has_task = any(
-            re.search(p, all_content, re.IGNORECASE) for p in task_patterns
-        )
+        has_task = self.TASK_RE.search(content_lower) is not None
         if has_task:
             details.append("Clear task instructions present")
         else:
@@ -199,10 +315,7 @@ class QualityScorer:
             suggestions.append("Add explicit task instructions")
 
         # Check for output format specification
-        output_patterns = [r"<output_format>", r"respond in", r"format your"]
-        has_output = any(
-            re.search(p, all_content, re.IGNORECASE) for p in output_patterns
-        )
+        has_output = self.OUTPUT_RE.search(content_lower) is not None
         if has_output:
             details.append("Output format specified")
         else:
@@ -225,16 +338,7 @@ class QualityScorer:
                 details.append(f"{vars_with_desc}/{total_vars} variables documented")
 
         # Check for ambiguous language
-        ambiguous_patterns = [
-            r"\bmaybe\b",
-            r"\bperhaps\b",
-            r"\bmight want to\b",
-            r"\bcould potentially\b",
-        ]
-        ambiguous_count = sum(
-            len(re.findall(p, all_content, re.IGNORECASE))
-            for p in ambiguous_patterns
-        )
+        ambiguous_count = len(self.AMBIGUOUS_RE.findall(content_lower))
         if ambiguous_count > 2:
             score -= 10
             details.append(f"Found {ambiguous_count} ambiguous phrases")
@@ -242,10 +346,10 @@ class QualityScorer:
 
         return DimensionScore(
             dimension=QualityDimension.CLARITY,
-            score=max(0, score),
+            score=self._clamp(score),
             weight=self.DIMENSION_WEIGHTS[QualityDimension.CLARITY],
-            details=details,
-            suggestions=suggestions,
+            details=tuple(details),
+            suggestions=tuple(suggestions),
         )
 
     def _score_consistency(self, config: TemplateConfig) -> DimensionScore:
@@ -257,9 +361,14 @@ class QualityScorer:
         # Check naming consistency
         var_names = [v.name for v in config.variables]
 
-        # Check for mixed naming conventions
-        snake_case = sum(1 for n in var_names if "_" in n)
-        camel_case = sum(1 for n in var_names if re.search(r"[a-z][A-Z]", n))
+        # Check for mixed naming conventions in one pass over the names;
+        # all-lowercase names cannot be camelCase, so skip the regex for them
+        snake_case = camel_case = 0
+        for n in var_names:
+            if "_" in n:
+                snake_case += 1
+            if not n.islower() and self.CAMEL_CASE_RE.search(n):
+                camel_case += 1
 
         if snake_case > 0 and camel_case > 0:
             score -= 15
@@ -271,7 +380,7 @@ class QualityScorer:
         # Check type consistency
         for var in config.variables:
             if var.type.value == "string" and var.enum:
-                if any(not isinstance(e, str) for e in var.enum):
+                if not all(map(isinstance, var.enum, repeat(str))):
                     score -= 10
                     details.append(
                         f"Variable '{var.name}' has inconsistent enum types"
@@ -317,13 +426,15 @@ class QualityScorer:
 
         return DimensionScore(
             dimension=QualityDimension.CONSISTENCY,
-            score=max(0, score),
+            score=self._clamp(score),
             weight=self.DIMENSION_WEIGHTS[QualityDimension.CONSISTENCY],
-            details=details,
-            suggestions=suggestions,
+            details=tuple(details),
+            suggestions=tuple(suggestions),
         )
 
-    def _score_completeness(self, config: TemplateConfig) -> DimensionScore:
+    def _score_completeness(
+        self, config: TemplateConfig, all_content: str
+    ) -> DimensionScore:
         """Score completeness of the template."""
         score = 100
         details: list[str] = []
@@ -379,13 +490,6 @@ class QualityScorer:
             details.append("Optional variables have no default values")
             suggestions.append("Add default values for optional variables")
 
-        # Check for required components
-        all_content = (
-            (config.system_prompt or "")
-            + (config.user_prompt or "")
-            + (config.template or "")
-        )
-
         # Should have some kind of structure for longer templates
         has_structure = any(
             [
@@ -403,15 +507,17 @@ class QualityScorer:
 
         return DimensionScore(
             dimension=QualityDimension.COMPLETENESS,
-            score=max(0, score),
+            score=self._clamp(score),
             weight=self.DIMENSION_WEIGHTS[QualityDimension.COMPLETENESS],
-            details=details,
-            suggestions=suggestions,
+            details=tuple(details),
+            suggestions=tuple(suggestions),
         )
 
     def _score_efficiency(
         self,
         config: TemplateConfig,
+        all_content: str,
+        content_lower: str,
         sample_values: dict[str, Any] | None = None,
     ) -> DimensionScore:
         """Score efficiency of the template."""
@@ -419,12 +525,6 @@ class QualityScorer:
         details: list[str] = []
         suggestions: list[str] = []
 
-        all_content = (
-            (config.system_prompt or "")
-            + (config.user_prompt or "")
-            + (config.template or "")
-        )
-
         # Check token efficiency
         token_count = self.token_counter.count_tokens(all_content)
 
@@ -440,7 +540,7 @@ class QualityScorer:
             details.append(f"Token count: {token_count}")
 
         # Check for redundancy (repeated words)
-        words = all_content.lower().split()
+        words = content_lower.split()
         word_freq: dict[str, int] = {}
         for word in words:
             if len(word) > 4:
@@ -456,10 +556,10 @@ class QualityScorer:
                 score -= 10
                 suggestions.append("Review template for unnecessary repetition")
 
-        # Check variable usage efficiency
+        # Check variable usage efficiency; count every placeholder in one pass
+        usage_counts = Counter(self.PLACEHOLDER_RE.findall(all_content))
         for var in config.variables:
-            pattern = r"\{\{\s*" + re.escape(var.name) + r"\s*\}\}"
-            usage_count = len(re.findall(pattern, all_content))
+            usage_count = usage_counts[var.name]
             if usage_count > 5:
                 score -= 5
                 details.append(f"Variable '{var.name}' used {usage_count} times")
@@ -468,7 +568,7 @@ class QualityScorer:
                 )
 
         # Check for overly complex Jinja logic
-        jinja_blocks = len(re.findall(r"\{%", all_content))
+        jinja_blocks = all_content.count("{%")
         if jinja_blocks > 10:
             score -= 15
             details.append(f"High Jinja complexity: {jinja_blocks} blocks")
@@ -478,13 +578,15 @@ class QualityScorer:
 
         return DimensionScore(
             dimension=QualityDimension.EFFICIENCY,
-            score=max(0, score),
+            score=self._clamp(score),
             weight=self.DIMENSION_WEIGHTS[QualityDimension.EFFICIENCY],
-            details=details,
-            suggestions=suggestions,
+            details=tuple(details),
+            suggestions=tuple(suggestions),
         )
 
-    def _score_structure(self, config: TemplateConfig) -> DimensionScore:
+    def _score_structure(
+        self, config: TemplateConfig, all_content: str, content_lower: str
+    ) -> DimensionScore:
         """Score structural quality of the template."""
         score = 100
         details: list[str] = []
@@ -508,16 +610,10 @@ class QualityScorer:
                     suggestions.append(msg)
 
         # Check section organization
-        all_content = (
-            (config.system_prompt or "")
-            + (config.user_prompt or "")
-            + (config.template or "")
-        )
-
         # Count structural elements
-        xml_tags = len(re.findall(r"<[a-z_]+>", all_content, re.IGNORECASE))
-        md_headers = len(re.findall(r"^#{1,3}\s", all_content, re.MULTILINE))
-        section_markers = len(re.findall(r"^===", all_content, re.MULTILINE))
+        xml_tags = len(self.XML_TAG_RE.findall(content_lower))
+        md_headers = len(self.MD_HEADER_RE.findall(all_content))
+        section_markers = len(self.SECTION_MARKER_RE.findall(all_content))
 
         total_structure = xml_tags + md_headers + section_markers
 
@@ -534,9 +630,7 @@ class QualityScorer:
         # Check nesting depth
         max_depth = 0
         current_depth = 0
-        for match in re.finditer(
-            r"\{%\s*(if|for|endif|endfor)\s*", all_content
-        ):
+        for match in self.NESTING_TAG_RE.finditer(all_content):
             tag = match.group(1)
             if tag in ("if", "for"):
                 current_depth += 1
@@ -553,21 +647,12 @@ class QualityScorer:
 
         return DimensionScore(
             dimension=QualityDimension.STRUCTURE,
-            score=min(100, max(0, score)),  # Clamp to 0-100
+            score=self._clamp(score),
             weight=self.DIMENSION_WEIGHTS[QualityDimension.STRUCTURE],
-            details=details,
-            suggestions=suggestions,
+            details=tuple(details),
+            suggestions=tuple(suggestions),
         )
 
     def _generate_summary(self, overall_score: int, grade: str) -> str:
         """Generate a summary of the quality assessment."""
-        if grade == "A":
-            return "Excellent quality template, ready for production use."
-        elif grade == "B":
-            return "Good quality template with minor improvements possible."
-        elif grade == "C":
-            return "Acceptable template, but several areas need attention."
-        elif grade == "D":
-            return "Below average quality, significant improvements recommended."
-        else:
-            return "Poor quality template, requires substantial revision."
+        return self.GRADE_SUMMARIES.get(grade, self.GRADE_SUMMARIES["F"])
@@ -3,16 +3,62 @@
 from __future__ import annotations
 
 import builtins
+import heapq
+import json
 import logging
-from collections.abc import Iterator
+import os
+from collections.abc import Generator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from dataclasses import dataclass, field
-from difflib import get_close_matches
 from pathlib import Path
+from typing import Any
 
+from .models import TemplateConfig
 from .template import Template, TemplateNotFoundError, TemplateValidationError
 
 logger = logging.getLogger(__name__)
 
+# Environment variable naming a file for the persistent template index
+INDEX_CACHE_ENV = "PROMPT_TEMPLATE_INDEX_CACHE"
+
+# Bumped whenever the on-disk index layout changes
+_INDEX_VERSION = 1
+
+
+def _close_matches(
+    word: str, possibilities: list[str], n: int = 3, cutoff: float = 0.4
+) -> list[str]:
+    """Find the names most similar to word, best match first.
+
+    Uses rapidfuzz's C implementation when installed and falls back to
+    difflib otherwise. rapidfuzz scores by Indel distance and difflib by
+    Ratcliff/Obershelp matching, so the two can suggest different names;
+    ties are ordered like difflib either way (higher score first, then
+    the greater name).
+
+    Args:
+        word: Name to find matches for
+        possibilities: Candidate names
+        n: Maximum number of matches to return
+        cutoff: Minimum similarity in [0, 1] for a candidate to match
+
+    Returns:
+        Up to n matching names
+    """
+    try:
+        from rapidfuzz import fuzz, process
+    except ImportError:
+        from difflib import get_close_matches
+
+        return get_close_matches(word, possibilities, n=n, cutoff=cutoff)
+
+    matches = process.extract(
+        word, possibilities, scorer=fuzz.ratio, limit=None, score_cutoff=cutoff * 100
+    )
+    best = heapq.nlargest(n, ((score, match) for match, score, _index in matches))
+    return [match for _score, match in best]
+
 
 @dataclass
 class TemplateInfo:
@@ -30,17 +76,37 @@ class TemplateRegistry:
 
     SUPPORTED_EXTENSIONS = {".yaml", ".yml", ".json"}
 
-    def __init__(self, search_paths: list[Path] | None = None) -> None:
+    # Upper bound on threads used to parse template files during discovery
+    MAX_DISCOVERY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+    def __init__(
+        self,
+        search_paths: list[Path] | None = None,
+        index_path: str | Path | None = None,
+    ) -> None:
         """Initialize the registry.
 
         Args:
             search_paths: List of directories to search for templates.
                          If None, uses default paths.
+            index_path: File for a persistent index of template metadata,
+                which lets discovery skip parsing unchanged files across
+                processes. Defaults to the PROMPT_TEMPLATE_INDEX_CACHE
+                environment variable; when neither is set, no index is kept.
         """
         if search_paths is None:
             search_paths = self._default_search_paths()
 
         self.search_paths = [Path(p) for p in search_paths]
+        # Parsed configs by file, reused while (mtime_ns, size) is unchanged
+        self._configs: dict[Path, tuple[tuple[int, int], TemplateConfig]] = {}
+
+        if index_path is None:
+            index_path = os.environ.get(INDEX_CACHE_ENV) or None
+        self._index_path = Path(index_path).expanduser() if index_path else None
+        # Template info by file path string, as [mtime_ns, size, info or None]
+        self._index: dict[str, builtins.list[Any]] | None = None
+        self._index_dirty = False
 
     @staticmethod
     def _default_search_paths() -> list[Path]:
@@ -91,28 +157,45 @@ class TemplateRegistry:
             if not base_path.exists():
                 continue
 
+            subdirs: builtins.list[Path] | None = None
             for ext in self.SUPPORTED_EXTENSIONS:
                 candidate = base_path / f"{name}{ext}"
                 if candidate.exists():
                     return candidate
 
-                # Also check subdirectories
-                try:
-                    for subdir in base_path.iterdir():
-                        if subdir.is_dir():
-                            candidate = subdir / f"{name}{ext}"
-                            if candidate.exists():
-                                return candidate
-                except PermissionError:
-                    continue  # Skip directories we cannot read
-
-        # If not found by file name, search by template name (inside YAML)
-        for info in self._discover_templates():
-            if info.name == name:
-                return info.path
+                # Also check subdirectories, listed once per search path
+                if subdirs is None:
+                    subdirs = self._list_subdirs(base_path)
+                for subdir in subdirs:
+                    candidate = subdir / f"{name}{ext}"
+                    if candidate.exists():
+                        return candidate
+
+        # If not found by file name, search by template name (inside YAML).
+        # Discovery runs every time so new or renamed files in higher-priority
+        # paths are seen; unchanged files are not parsed again.
+        with closing(self._discover_templates()) as infos:
+            for info in infos:
+                if info.name == name:
+                    return info.path
 
         return None
 
+    @staticmethod
+    def _list_subdirs(directory: Path) -> builtins.list[Path]:
+        """List the immediate subdirectories of a directory.
+
+        Args:
+            directory: Directory to list
+
+        Returns:
+            Subdirectories, or an empty list if the directory is unreadable
+        """
+        try:
+            return [item for item in directory.iterdir() if item.is_dir()]
+        except PermissionError:
+            return []  # Skip directories we cannot read
+
     def load(self, name: str) -> Template:
         """Load a template by name.
 
@@ -128,9 +211,9 @@ class TemplateRegistry:
         path = self.find(name)
 
         if path is None:
-            # Get suggestions for similar names
-            available = [t.name for t in self.list()]
-            suggestions = get_close_matches(name, available, n=3, cutoff=0.4)
+            # Get suggestions for similar names (too short names match noise)
+            available = [t.name for t in self.list()] if len(name) >= 3 else []
+            suggestions = _close_matches(name, available)
 
             suggestion_text = None
             if suggestions:
@@ -144,7 +227,40 @@ class TemplateRegistry:
                 },
             )
 
-        return Template.from_file(path)
+        # Hand out a copy so callers cannot modify the cached config
+        return Template(self._load_config(path).model_copy(deep=True))
+
+    def _load_config(self, path: Path) -> TemplateConfig:
+        """Load the configuration of a template file.
+
+        Parsed configurations are cached and reused while the file's
+        modification time and size are unchanged, so discovery followed
+        by load() parses each file once. The result is shared with the
+        cache and must not be modified.
+
+        Args:
+            path: Path to template file
+
+        Returns:
+            The parsed template configuration
+
+        Raises:
+            TemplateNotFoundError: If the file does not exist
+            TemplateValidationError: If the file content is invalid
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            return Template._config_from_file(path)  # Raises the usual errors
+
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._configs.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        config = Template._config_from_file(path)
+        self._configs[path] = (stamp, config)
+        return config
 
     def list(self) -> builtins.list[TemplateInfo]:
         """List all available templates.
@@ -166,56 +282,133 @@ class TemplateRegistry:
         templates.sort(key=lambda t: t.name)
         return templates
 
-    def _discover_templates(self) -> Iterator[TemplateInfo]:
+    def _discover_templates(self) -> Generator[TemplateInfo, None, None]:
         """Discover all templates in search paths.
 
+        Candidate files are collected first, then parsed concurrently.
+        Results are yielded in discovery order so "first found wins"
+        semantics are preserved.
+
         Yields:
             TemplateInfo for each discovered template
         """
+        paths: builtins.list[Path] = []
         for base_path in self.search_paths:
             if not base_path.exists():
                 continue
 
-            yield from self._scan_directory(base_path)
+            paths.extend(self._scan_directory(base_path))
+
+        if self._index_path is not None and self._index is None:
+            self._index = self._read_index(self._index_path)
 
-    def _scan_directory(self, directory: Path) -> Iterator[TemplateInfo]:
+        # Flush index updates even when the caller stops iterating early
+        try:
+            if len(paths) < 2:
+                infos: Iterator[TemplateInfo | None] = map(
+                    self._get_template_info, paths
+                )
+                yield from (info for info in infos if info)
+            else:
+                max_workers = min(self.MAX_DISCOVERY_WORKERS, len(paths))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    try:
+                        for info in executor.map(self._get_template_info, paths):
+                            if info:
+                                yield info
+                    finally:
+                        # Drop files not yet parsed when iteration stops early
+                        executor.shutdown(cancel_futures=True)
+        finally:
+            if self._index_dirty:
+                self._write_index()
+
+    def _scan_directory(self, directory: Path) -> Iterator[Path]:
         """Scan a directory for template files.
 
+        Uses os.scandir so file types come from the directory listing
+        instead of a stat call per entry.
+
         Args:
             directory: Directory to scan
 
         Yields:
-            TemplateInfo for each template found
+            Path of each candidate template file found
         """
         try:
-            for item in directory.iterdir():
-                if item.is_file() and item.suffix in self.SUPPORTED_EXTENSIONS:
-                    info = self._get_template_info(item)
-                    if info:
-                        yield info
-                elif item.is_dir() and not item.name.startswith("."):
-                    # Recursively scan subdirectories
-                    yield from self._scan_directory(item)
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        if os.path.splitext(entry.name)[1] in self.SUPPORTED_EXTENSIONS:
+                            yield directory / entry.name
+                    elif entry.is_dir() and not entry.name.startswith("."):
+                        # Recursively scan subdirectories
+                        yield from self._scan_directory(directory / entry.name)
         except PermissionError:
             pass  # Skip directories we can't read
 
     def _get_template_info(self, path: Path) -> TemplateInfo | None:
         """Extract template info from a file.
 
+        When a persistent index is configured, info for files whose
+        modification time and size are unchanged is taken from the index
+        instead of parsing the file.
+
         Args:
             path: Path to template file
 
         Returns:
             TemplateInfo or None if file is invalid
         """
+        if self._index is None:
+            return self._read_template_info(path)
+
         try:
-            template = Template.from_file(path)
+            st = path.stat()
+        except OSError:
+            return self._read_template_info(path)
+
+        key = str(path)
+        entry = self._index.get(key)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            record = entry[2]
+            if record is None:
+                return None
+            try:
+                return TemplateInfo(path=path, **record)
+            except TypeError:
+                pass  # Malformed entry; reparse the file below
+
+        info = self._read_template_info(path)
+        record = None
+        if info is not None:
+            record = {
+                "name": info.name,
+                "description": info.description,
+                "version": info.version,
+                "tags": info.tags,
+            }
+        self._index[key] = [st.st_mtime_ns, st.st_size, record]
+        self._index_dirty = True
+        return info
+
+    def _read_template_info(self, path: Path) -> TemplateInfo | None:
+        """Parse a template file and extract its info.
+
+        Args:
+            path: Path to template file
+
+        Returns:
+            TemplateInfo or None if file is invalid
+        """
+        try:
+            config = self._load_config(path)
             return TemplateInfo(
-                name=template.name,
+                name=config.name,
                 path=path,
-                description=template.description,
-                version=template.config.version,
-                tags=template.config.tags,
+                description=config.description,
+                version=config.version,
+                tags=list(config.tags),
             )
         except (TemplateValidationError, TemplateNotFoundError) as e:
             # Expected errors for invalid templates - log at debug level
@@ -226,6 +419,43 @@ class TemplateRegistry:
             logger.warning("Unexpected error reading template %s: %s", path, e)
             return None
 
+    @staticmethod
+    def _read_index(index_path: Path) -> dict[str, builtins.list[Any]]:
+        """Read the persistent template index, ignoring unusable files.
+
+        Args:
+            index_path: Path to the index file
+
+        Returns:
+            Index entries by file path string, empty if none could be read
+        """
+        try:
+            data = json.loads(index_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _INDEX_VERSION:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def _write_index(self) -> None:
+        """Atomically write the persistent template index."""
+        if self._index_path is None or self._index is None:
+            return
+
+        payload = {"version": _INDEX_VERSION, "entries": self._index}
+        tmp_path = self._index_path.with_name(
+            f"{self._index_path.name}.{os.getpid()}.tmp"
+        )
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp_path, self._index_path)
+        except OSError as e:
+            logger.debug("Could not write template index %s: %s", self._index_path, e)
+            return
+        self._index_dirty = False
+
     def search(
         self,
         query: str | None = None,
@@ -241,23 +471,25 @@ class TemplateRegistry:
             List of matching templates
         """
         templates = self.list()
-
-        if query:
-            query_lower = query.lower()
-            templates = [
-                t
-                for t in templates
-                if query_lower in t.name.lower()
+        if not query and not tags:
+            return templates
+
+        # Filter on both criteria in a single pass over the templates
+        query_lower = query.lower() if query else ""
+        tags_set = frozenset(tag.lower() for tag in tags) if tags else None
+        templates = [
+            t
+            for t in templates
+            if (
+                not query_lower
+                or query_lower in t.name.lower()
                 or query_lower in t.description.lower()
-            ]
-
-        if tags:
-            tags_set = set(tag.lower() for tag in tags)
-            templates = [
-                t
-                for t in templates
-                if any(tag.lower() in tags_set for tag in t.tags)
-            ]
+            )
+            and (
+                tags_set is None
+                or not tags_set.isdisjoint(tag.lower() for tag in t.tags)
+            )
+        ]
 
         return templates
 
@@ -1,31 +1,220 @@
 """Jinja2-based template renderer."""
 
+import hashlib
+import logging
+import os
 import re
-from typing import Any
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, ClassVar, TypeVar
 
 from jinja2 import (
+    BaseLoader,
+    Environment,
+    FileSystemBytecodeCache,
     StrictUndefined,
+    Template,
+    TemplateNotFound,
     TemplateSyntaxError,
     UndefinedError,
-    meta,
+    nodes,
 )
 from jinja2.sandbox import SandboxedEnvironment
 
+_T = TypeVar("_T")
+
+logger = logging.getLogger(__name__)
+
+# Fallback variable extraction: matches {{ variable }} and {{ variable.attr }}
+_FALLBACK_VAR_RE = re.compile(r"\{\{\s*([a-zA-Z_][a-zA-Z0-9_]*)")
+
+# A whole expression that is just a bare name, e.g. {{ variable }}
+_SIMPLE_VAR_RE = re.compile(r"\{\{\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*\}\}")
+
+# Bare names Jinja2 treats as constants rather than variables
+_JINJA_CONSTANTS = frozenset({"true", "false", "none", "True", "False", "None"})
+
+# Newline sequences Jinja2 normalizes to "\n" in template text
+_NEWLINE_RE = re.compile(r"\r\n?")
+
+# Environment variable naming a directory for the Jinja2 bytecode cache
+BYTECODE_CACHE_ENV = "PROMPT_TEMPLATE_BYTECODE_CACHE"
+
+
+def _cached(
+    cache: OrderedDict[str, _T],
+    key: str,
+    factory: Callable[[str], _T],
+    maxsize: int,
+    lock: threading.Lock,
+) -> _T:
+    """Look up key in an LRU cache, building and inserting it on a miss.
+
+    The lock guards the cache itself. It is released while the value is
+    built, since factories may use other caches behind the same lock; two
+    threads missing on the same key at once both build it.
+    """
+    with lock:
+        try:
+            value = cache[key]
+        except KeyError:
+            pass
+        else:
+            cache.move_to_end(key)
+            return value
+
+    value = factory(key)
+    with lock:
+        cache[key] = value
+        if len(cache) > maxsize:
+            cache.popitem(last=False)
+    return value
+
+
+def _has_markup(template_string: str) -> bool:
+    """Check whether a string contains any Jinja2 delimiters."""
+    return "{{" in template_string or "{%" in template_string or "{#" in template_string
+
+
+class _SourceLoader(BaseLoader):
+    """Serves in-memory template sources registered under a digest name.
+
+    Routing string templates through a loader lets Jinja2 consult the
+    environment's bytecode cache, which ``from_string`` never does.
+    """
+
+    def __init__(self) -> None:
+        self.sources: dict[str, str] = {}
+
+    def get_source(
+        self, environment: Environment, template: str
+    ) -> tuple[str, str | None, Callable[[], bool]]:
+        try:
+            return self.sources[template], None, lambda: True
+        except KeyError:
+            raise TemplateNotFound(template)
+
 
 class TemplateRenderer:
     """Renders templates using Jinja2."""
 
-    def __init__(self, autoescape: bool = False) -> None:
+    # Maximum number of template strings kept in each compile/parse cache
+    CACHE_SIZE: ClassVar[int] = 256
+
+    def __init__(
+        self, autoescape: bool = False, cache_dir: str | Path | None = None
+    ) -> None:
         """Initialize the renderer with a Jinja2 environment.
 
         Args:
             autoescape: Whether to autoescape HTML (default False for prompts)
+            cache_dir: Directory for the Jinja2 bytecode cache. Defaults to the
+                PROMPT_TEMPLATE_BYTECODE_CACHE environment variable; when
+                neither is set, no bytecode cache is used.
         """
+        if cache_dir is None:
+            cache_dir = os.environ.get(BYTECODE_CACHE_ENV) or None
+
+        bytecode_cache = None
+        self._loader: _SourceLoader | None = None
+        if cache_dir is not None:
+            cache_path = Path(cache_dir).expanduser()
+            try:
+                cache_path.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                # The cache only saves compile time, so run without it
+                logger.debug("Not using bytecode cache %s: %s", cache_path, e)
+            else:
+                bytecode_cache = FileSystemBytecodeCache(directory=str(cache_path))
+                self._loader = _SourceLoader()
+        # Guards the loader's sources while a template is compiled from them
+        self._loader_lock = threading.Lock()
+
         # Use SandboxedEnvironment to prevent template injection attacks
         self.env = SandboxedEnvironment(
             autoescape=autoescape,
             # Use StrictUndefined to raise errors for undefined variables
             undefined=StrictUndefined,
+            loader=self._loader,
+            bytecode_cache=bytecode_cache,
+            cache_size=400,
+        )
+        # Lenient sandboxed environment used for previews (undefined is allowed)
+        self._lenient_env = SandboxedEnvironment(autoescape=False)
+        # Compiled templates and parsed ASTs keyed by template source
+        self._compiled_cache: OrderedDict[str, Template] = OrderedDict()
+        self._lenient_cache: OrderedDict[str, Template] = OrderedDict()
+        self._ast_cache: OrderedDict[str, nodes.Template] = OrderedDict()
+        self._vars_cache: OrderedDict[str, frozenset[str]] = OrderedDict()
+        # Format strings (and their variables) for plain {{ name }} templates
+        self._simple_cache: OrderedDict[str, tuple[str, frozenset[str]] | None] = (
+            OrderedDict()
+        )
+        # Renderers are shared across threads, so the caches above are locked
+        self._cache_lock = threading.Lock()
+
+    def compile(self, template_string: str) -> Template:
+        """Compile a template, reusing a cached one when possible.
+
+        Args:
+            template_string: The Jinja2 template string
+
+        Returns:
+            The compiled Jinja2 template
+
+        Raises:
+            TemplateSyntaxError: If template syntax is invalid
+        """
+        return _cached(
+            self._compiled_cache,
+            template_string,
+            self._build_template,
+            self.CACHE_SIZE,
+            self._cache_lock,
+        )
+
+    def _build_template(self, template_string: str) -> Template:
+        """Compile a template, going through the loader when bytecode caching.
+
+        Args:
+            template_string: The Jinja2 template string
+
+        Returns:
+            The compiled template
+        """
+        if self._loader is None:
+            return self.env.from_string(template_string)
+
+        name = hashlib.sha256(template_string.encode("utf-8")).hexdigest()
+        # Held until the source is removed again, so concurrent compiles of
+        # the same template cannot delete it while another is loading it
+        with self._loader_lock:
+            self._loader.sources[name] = template_string
+            try:
+                return self.env.get_template(name)
+            finally:
+                del self._loader.sources[name]
+
+    def _compile_lenient(self, template_string: str) -> Template:
+        """Get a compiled preview template, reusing a cached one when possible."""
+        return _cached(
+            self._lenient_cache,
+            template_string,
+            self._lenient_env.from_string,
+            self.CACHE_SIZE,
+            self._cache_lock,
+        )
+
+    def _parse(self, template_string: str) -> nodes.Template:
+        """Get the parsed AST of a template, reusing a cached one when possible."""
+        return _cached(
+            self._ast_cache,
+            template_string,
+            self.env.parse,
+            self.CACHE_SIZE,
+            self._cache_lock,
         )
 
     def render(self, template_string: str, variables: dict[str, Any]) -> str:
@@ -42,7 +231,21 @@ class TemplateRenderer:
             TemplateSyntaxError: If template syntax is invalid
             UndefinedError: If required variables are missing
         """
-        template = self.env.from_string(template_string)
+        return self.render_compiled(self.compile(template_string), variables)
+
+    def render_compiled(self, template: Template, variables: dict[str, Any]) -> str:
+        """Render an already compiled template with the given variables.
+
+        Args:
+            template: A template returned by compile()
+            variables: Dictionary of variable values
+
+        Returns:
+            The rendered template string
+
+        Raises:
+            UndefinedError: If required variables are missing
+        """
         return template.render(**variables)
 
     def extract_variables(self, template_string: str) -> set[str]:
@@ -54,12 +257,55 @@ class TemplateRenderer:
         Returns:
             Set of variable names found in the template
         """
+        if not _has_markup(template_string):
+            return set()
+        cached = _cached(
+            self._vars_cache,
+            template_string,
+            self._find_variables,
+            self.CACHE_SIZE,
+            self._cache_lock,
+        )
+        return set(cached)
+
+    def _simple_variables(self, template_string: str) -> frozenset[str] | None:
+        """Get the variables of a template made only of {{ name }} expressions.
+
+        Returns:
+            The variable names, or None if the template uses any other
+            Jinja2 syntax and must be parsed
+        """
+        matches = _SIMPLE_VAR_RE.findall(template_string)
+        names = frozenset(matches)
+        if (
+            len(matches) == template_string.count("{{")
+            # A brace touching a delimiter starts a dict literal or shifts
+            # where Jinja2 sees the delimiter, e.g. {{{ name }}}
+            and "{{{" not in template_string
+            and "}}}" not in template_string
+            and "{%" not in template_string
+            and "{#" not in template_string
+            and names.isdisjoint(_JINJA_CONSTANTS)
+            and names.isdisjoint(self.env.globals)
+        ):
+            return names
+        return None
+
+    def _find_variables(self, template_string: str) -> frozenset[str]:
+        """Extract variable names from a template without caching."""
+        # Templates made only of plain {{ name }} expressions need no parse
+        names = self._simple_variables(template_string)
+        if names is not None:
+            return names
+
+        from jinja2 import meta
+
         try:
-            ast = self.env.parse(template_string)
-            return meta.find_undeclared_variables(ast)
+            ast = self._parse(template_string)
+            return frozenset(meta.find_undeclared_variables(ast))
         except TemplateSyntaxError:
             # Fall back to regex for invalid templates
-            return self._extract_variables_regex(template_string)
+            return frozenset(self._extract_variables_regex(template_string))
 
     def _extract_variables_regex(self, template_string: str) -> set[str]:
         """Extract variables using regex (fallback method).
@@ -70,10 +316,7 @@ class TemplateRenderer:
         Returns:
             Set of variable names found
         """
-        # Match {{ variable }} and {{ variable.attr }} patterns
-        pattern = r"\{\{\s*([a-zA-Z_][a-zA-Z0-9_]*)"
-        matches = re.findall(pattern, template_string)
-        return set(matches)
+        return set(_FALLBACK_VAR_RE.findall(template_string))
 
     def validate_syntax(self, template_string: str) -> list[str]:
         """Validate template syntax.
@@ -86,12 +329,14 @@ class TemplateRenderer:
         """
         errors: list[str] = []
 
-        try:
-            self.env.parse(template_string)
-        except TemplateSyntaxError as e:
-            errors.append(f"Syntax error: {e.message}")
-            if e.lineno:
-                errors.append(f"  at line {e.lineno}")
+        # Plain text cannot fail to parse; only the brace checks apply
+        if _has_markup(template_string):
+            try:
+                self._parse(template_string)
+            except TemplateSyntaxError as e:
+                errors.append(f"Syntax error: {e.message}")
+                if e.lineno:
+                    errors.append(f"  at line {e.lineno}")
 
         # Check for unbalanced braces
         open_braces = template_string.count("{{")
@@ -102,9 +347,10 @@ class TemplateRenderer:
                 f"{close_braces} closing '}}}}'"
             )
 
-        # Check for common mistakes
-        if "{%" in template_string:
-            open_blocks = template_string.count("{%")
+        # Check for common mistakes (str.count is a C-level scan; counting
+        # directly avoids a separate membership pass over the template)
+        open_blocks = template_string.count("{%")
+        if open_blocks:
             close_blocks = template_string.count("%}")
             if open_blocks != close_blocks:
                 errors.append(
@@ -141,9 +387,11 @@ class TemplateRenderer:
                 preview_vars[var] = f"[{var}]"
 
         try:
-            # Use a lenient sandboxed environment for preview
-            lenient_env = SandboxedEnvironment(autoescape=False)
-            template = lenient_env.from_string(template_string)
+            rendered = self.render_simple(template_string, preview_vars)
+            if rendered is not None:
+                return rendered
+            # Use the lenient sandboxed environment for preview
+            template = self._compile_lenient(template_string)
             return template.render(**preview_vars)
         except TemplateSyntaxError as e:
             return f"Preview error (syntax): {e.message}"
@@ -151,3 +399,57 @@ class TemplateRenderer:
             return f"Preview error (undefined variable): {e}"
         except Exception as e:
             return f"Preview error: {e}"
+
+    def render_simple(
+        self, template_string: str, variables: dict[str, Any]
+    ) -> str | None:
+        """Render a template of plain {{ name }} expressions without Jinja2.
+
+        Such templates are converted once to a str.format_map format string,
+        which fills them in a single C-level pass.
+
+        Args:
+            template_string: The template string
+            variables: Dictionary of variable values
+
+        Returns:
+            The rendered string, or None if the template uses other Jinja2
+            syntax or a variable is missing; render it with Jinja2 instead
+        """
+        compiled = _cached(
+            self._simple_cache,
+            template_string,
+            self._compile_simple,
+            self.CACHE_SIZE,
+            self._cache_lock,
+        )
+        if compiled is None:
+            return None
+        fmt, names = compiled
+        if not names.issubset(variables):
+            return None
+        return fmt.format_map(variables)
+
+    def _compile_simple(
+        self, template_string: str
+    ) -> tuple[str, frozenset[str]] | None:
+        """Convert a plain {{ name }} template to a format string.
+
+        Matches Jinja2's output: template text has its newlines normalized
+        and a single trailing newline removed, and values are converted
+        with str().
+        """
+        names = self._simple_variables(template_string)
+        if names is None:
+            return None
+
+        text = _NEWLINE_RE.sub("\n", template_string)
+        if text.endswith("\n"):
+            text = text[:-1]
+        # split() alternates literal text and captured variable names
+        parts = _SIMPLE_VAR_RE.split(text)
+        fmt = "".join(
+            "{" + part + "!s}" if i % 2 else part.replace("{", "{{").replace("}", "}}")
+            for i, part in enumerate(parts)
+        )
+        return fmt, names
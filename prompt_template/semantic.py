@@ -2,16 +2,160 @@
 
 from __future__ import annotations
 
+import math
 import re
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, ClassVar
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, Protocol
 
 from .validator import ValidationResult
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from .models import TemplateConfig
 
+# Matches a simple {{ variable }} placeholder, capturing the variable name
+_VAR_RE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+# Matches lowercase words of four or more letters (key terms)
+_WORD_RE = re.compile(r"\b[a-z]{4,}\b")
+
+# Characters on each side of a placeholder inspected for surrounding context
+_CONTEXT_CHARS = 20
+
+# Characters that end the literal prefix of a regex pattern
+_REGEX_META = frozenset("\\.^$*+?{}[]|()")
+
+
+@lru_cache(maxsize=256)
+def _extract_terms(text: str) -> frozenset[str]:
+    """Extract key terms (lowercase words of 4+ letters) from lowercased text.
+
+    Memoized by text so repeated validation of unchanged templates reuses
+    the term sets for both the description and the prompt content.
+    """
+    return frozenset(_WORD_RE.findall(text))
+
+
+@lru_cache(maxsize=32)
+def _compile_union(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile patterns into one case-insensitive alternation.
+
+    Memoized by pattern tuple so validators share the compiled regex.
+    """
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+@lru_cache(maxsize=32)
+def _literal_patterns(patterns: tuple[str, ...]) -> tuple[str, ...]:
+    """Select patterns that contain no regex syntax."""
+    return tuple(p for p in patterns if re.escape(p) == p)
+
+
+@lru_cache(maxsize=32)
+def _required_prefixes(patterns: tuple[str, ...]) -> tuple[str, ...] | None:
+    """Get casefolded literal prefixes, one of which every match must contain.
+
+    Text containing none of the prefixes cannot match the pattern union, so
+    the regex scan can be skipped. Returns None when some pattern has no
+    prefix that is certain to be required (e.g. it starts with a group, or
+    has a top-level alternation or a character class).
+    """
+    prefixes = []
+    for pattern in patterns:
+        if "[" in pattern:
+            return None
+        body = pattern.removeprefix(r"\b")
+        end = 0
+        while end < len(body) and body[end] not in _REGEX_META:
+            end += 1
+        prefix = body[:end]
+        if end < len(body) and body[end] in "?*{":
+            prefix = prefix[:-1]  # The quantifier makes the last char optional
+
+        # A "|" outside any group would make the prefix optional
+        depth = 0
+        escaped = False
+        for char in body[end:]:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+            elif char == "|" and depth == 0:
+                return None
+
+        if not prefix:
+            return None
+        prefixes.append(prefix.casefold())
+    return tuple(prefixes)
+
+
+def _has_sentence_overlap(first: str, second: str) -> bool:
+    """Check whether two texts share a long (30+ char) sentence.
+
+    Builds a set from the shorter text only and scans the longer one,
+    stopping at the first shared sentence.
+    """
+    short, long = (first, second) if len(first) <= len(second) else (second, first)
+    short_sentences = {
+        s for s in (part.strip() for part in short.lower().split(".")) if len(s) > 30
+    }
+    if not short_sentences:
+        return False
+    return any(part.strip() in short_sentences for part in long.lower().split("."))
+
+
+class _Searcher(Protocol):
+    """Anything that can report whether a pattern set matches text."""
+
+    def search(self, string: str, /) -> object: ...
+
+
+class _HyperscanMatcher:
+    """Case-insensitive "any match" scanner over a hyperscan pattern database.
+
+    Hyperscan compiles all patterns into a single automaton, so each scan
+    is one linear pass over the text with no backtracking. Unicode property
+    support (HS_FLAG_UCP) is left off because it makes compilation roughly
+    ten times slower; \\w and \\s therefore match ASCII only here.
+    """
+
+    def __init__(self, hyperscan: Any, patterns: tuple[str, ...]) -> None:
+        flags = (
+            hyperscan.HS_FLAG_CASELESS
+            | hyperscan.HS_FLAG_SINGLEMATCH
+            | hyperscan.HS_FLAG_UTF8
+        )
+        self._terminated = hyperscan.ScanTerminated
+        self._db = hyperscan.Database()
+        self._db.compile(
+            expressions=[p.encode("utf-8") for p in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=[flags] * len(patterns),
+        )
+
+    def search(self, string: str, /) -> bool:
+        """Return True if any pattern matches, stopping at the first match."""
+        if not string:
+            return False
+        try:
+            self._db.scan(string.encode("utf-8"), match_event_handler=_stop_scan)
+        except self._terminated:
+            return True
+        return False
+
+
+def _stop_scan(*_: Any) -> bool:
+    """Hyperscan match callback that halts the scan on the first match."""
+    return True
+
 
 class SemanticIssueType(str, Enum):
     """Types of semantic issues."""
@@ -24,18 +168,18 @@ class SemanticIssueType(str, Enum):
     PROMPT_STRUCTURE = "prompt_structure"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SemanticIssue:
     """A semantic issue found in validation."""
 
     type: SemanticIssueType
-    severity: str  # "error", "warning", "info"
+    severity: Literal["error", "warning", "info"]
     message: str
     location: str  # "system_prompt", "user_prompt", "template", "variables"
     suggestion: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SemanticValidationResult:
     """Result of semantic validation."""
 
@@ -48,12 +192,34 @@ class SemanticValidationResult:
     context_coherence_score: int = 100
     task_alignment_score: int = 100
 
+    # Issues grouped by type, kept in step with issues by add_issue
+    _issues_by_type: dict[SemanticIssueType, list[SemanticIssue]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Group issues passed to the constructor by type."""
+        for issue in self.issues:
+            self._issues_by_type.setdefault(issue.type, []).append(issue)
+
     def add_issue(self, issue: SemanticIssue) -> None:
         """Add an issue to the result."""
         self.issues.append(issue)
+        self._issues_by_type.setdefault(issue.type, []).append(issue)
         if issue.severity == "error":
             self.is_valid = False
 
+    def get_issues(self, issue_type: SemanticIssueType) -> list[SemanticIssue]:
+        """Get the issues of one type, in the order they were added.
+
+        Args:
+            issue_type: Type of issue to return
+
+        Returns:
+            Issues of that type (empty if there are none)
+        """
+        return list(self._issues_by_type.get(issue_type, ()))
+
     def to_validation_result(self) -> ValidationResult:
         """Convert to standard ValidationResult."""
         result = ValidationResult(is_valid=self.is_valid)
@@ -73,7 +239,7 @@ class SemanticValidator:
     """Validates semantic coherence of prompt templates."""
 
     # Patterns indicating role definition
-    ROLE_PATTERNS: ClassVar[list[str]] = [
+    ROLE_PATTERNS: ClassVar[tuple[str, ...]] = (
         r"you are\s+(a|an|the)\s+",
         r"act as\s+(a|an|the)\s+",
         r"<role>",
@@ -81,10 +247,10 @@ class SemanticValidator:
         r"your role is",
         r"you will be\s+(a|an|the)\s+",
         r"as\s+(a|an)\s+\w+,?\s+you",
-    ]
+    )
 
     # Patterns indicating task/instruction
-    TASK_PATTERNS: ClassVar[list[str]] = [
+    TASK_PATTERNS: ClassVar[tuple[str, ...]] = (
         r"your (task|job|goal|objective) is",
         r"you (should|must|will|need to)",
         r"please\s+\w+",
@@ -92,10 +258,10 @@ class SemanticValidator:
         r"<instructions>",
         r"i want you to",
         r"i need you to",
-    ]
+    )
 
     # Patterns indicating output format specification
-    OUTPUT_PATTERNS: ClassVar[list[str]] = [
+    OUTPUT_PATTERNS: ClassVar[tuple[str, ...]] = (
         r"<output_format>",
         r"<output>",
         r"respond in (this|the following) format",
@@ -103,36 +269,115 @@ class SemanticValidator:
         r"your (response|answer|output) should",
         r"use (this|the following) (format|structure)",
         r"return (the result|your answer) (as|in)",
-    ]
+    )
 
     # Ambiguous language patterns
-    AMBIGUOUS_PATTERNS: ClassVar[list[str]] = [
+    AMBIGUOUS_PATTERNS: ClassVar[tuple[str, ...]] = (
         r"\bmaybe\b",
         r"\bperhaps\b",
         r"\bmight want to\b",
         r"\bcould potentially\b",
         r"\bpossibly\b",
         r"\bif you want\b",
-    ]
+    )
+
+    # Class-level cache for the optional hyperscan module and its databases
+    _hyperscan: ClassVar[Any] = None
+    _hyperscan_available: ClassVar[bool | None] = None
+    _hyperscan_matchers: ClassVar[dict[tuple[str, ...], _Searcher]] = {}
+
+    def __init__(self, use_hyperscan: bool = False) -> None:
+        """Initialize the semantic validator.
 
-    def __init__(self) -> None:
-        """Initialize the semantic validator."""
+        Args:
+            use_hyperscan: Whether to use hyperscan (if installed) for the
+                role/task/output scans. Compiling the pattern databases costs
+                tens of milliseconds once per process, so this pays off for
+                large prompts or many validations.
+        """
+        self._use_hyperscan = use_hyperscan and self._check_hyperscan()
         self._compile_patterns()
 
+    @classmethod
+    def _check_hyperscan(cls) -> bool:
+        """Check if hyperscan is available."""
+        if cls._hyperscan_available is None:
+            try:
+                import hyperscan
+
+                cls._hyperscan = hyperscan
+                cls._hyperscan_available = True
+            except ImportError:
+                cls._hyperscan_available = False
+        return cls._hyperscan_available
+
     def _compile_patterns(self) -> None:
-        """Compile regex patterns."""
-        self._role_regex = [
-            re.compile(p, re.IGNORECASE) for p in self.ROLE_PATTERNS
-        ]
-        self._task_regex = [
-            re.compile(p, re.IGNORECASE) for p in self.TASK_PATTERNS
-        ]
-        self._output_regex = [
-            re.compile(p, re.IGNORECASE) for p in self.OUTPUT_PATTERNS
-        ]
-        self._ambiguous_regex = [
-            re.compile(p, re.IGNORECASE) for p in self.AMBIGUOUS_PATTERNS
-        ]
+        """Look up the matchers for each pattern category.
+
+        Compiled matchers are memoized per pattern tuple, so only the first
+        validator in a process pays for compilation.
+        """
+        role, task, output = (
+            tuple(self.ROLE_PATTERNS),
+            tuple(self.TASK_PATTERNS),
+            tuple(self.OUTPUT_PATTERNS),
+        )
+        self._role_regex = self._compile_matcher(role)
+        self._task_regex = self._compile_matcher(task)
+        self._output_regex = self._compile_matcher(output)
+        # Ambiguous phrases are counted, which needs re's non-overlapping
+        # match semantics, so they always use the re backend
+        self._ambiguous_regex = _compile_union(tuple(self.AMBIGUOUS_PATTERNS))
+
+        # Literal patterns (e.g. "<role>") checked with substring tests first
+        self._role_literals = _literal_patterns(role)
+        self._task_literals = _literal_patterns(task)
+        self._output_literals = _literal_patterns(output)
+
+        # Prefixes that must appear for a category to match at all
+        self._role_triggers = _required_prefixes(role)
+        self._task_triggers = _required_prefixes(task)
+        self._output_triggers = _required_prefixes(output)
+        self._ambiguous_triggers = _required_prefixes(tuple(self.AMBIGUOUS_PATTERNS))
+
+    def _compile_matcher(self, patterns: tuple[str, ...]) -> _Searcher:
+        """Compile patterns for "any match" checks, preferring hyperscan."""
+        if self._use_hyperscan:
+            matcher = self._hyperscan_matchers.get(patterns)
+            if matcher is None:
+                try:
+                    matcher = _HyperscanMatcher(self._hyperscan, patterns)
+                except self._hyperscan.error:
+                    # Pattern unsupported by hyperscan; fall back to re
+                    matcher = _compile_union(patterns)
+                self._hyperscan_matchers[patterns] = matcher
+            return matcher
+        return _compile_union(patterns)
+
+    @staticmethod
+    def _matches(
+        literals: tuple[str, ...],
+        triggers: tuple[str, ...] | None,
+        regex: _Searcher,
+        text: str,
+        folded: str | None = None,
+    ) -> bool:
+        """Check text against a category, trying substring tests first.
+
+        Exact literals are tried first, then text lacking every required
+        prefix is rejected without a regex scan. The regex still contains
+        the literals, so case variants such as "<ROLE>" are caught by the
+        case-insensitive fallback. Callers checking the same text against
+        several categories pass its casefolded form as folded.
+        """
+        if any(lit in text for lit in literals):
+            return True
+        if triggers is not None:
+            if folded is None:
+                folded = text.casefold()
+            if not any(t in folded for t in triggers):
+                return False
+        return bool(regex.search(text))
 
     def validate(self, config: TemplateConfig) -> SemanticValidationResult:
         """Perform semantic validation on a template.
@@ -145,39 +390,69 @@ class SemanticValidator:
         """
         result = SemanticValidationResult()
 
+        # Concatenate prompt content once and share it across checks
+        all_content = (
+            (config.system_prompt or "")
+            + (config.user_prompt or "")
+            + (config.template or "")
+        )
+        content_lower = all_content.lower()
+        content_folded = all_content.casefold()
+
         # Run all semantic checks
         self._check_role_definition(config, result)
-        self._check_instruction_clarity(config, result)
+        self._check_instruction_clarity(config, all_content, content_folded, result)
         self._check_context_coherence(config, result)
-        self._check_task_alignment(config, result)
-        self._check_placeholder_quality(config, result)
-        self._check_prompt_structure(config, result)
+        self._check_task_alignment(config, content_lower, result)
+        self._check_placeholder_quality(config, all_content, result)
+        self._check_prompt_structure(config, all_content, result)
 
         return result
 
+    def validate_many(
+        self, configs: Iterable[TemplateConfig]
+    ) -> list[SemanticValidationResult]:
+        """Perform semantic validation on several templates.
+
+        All templates are checked with this validator's compiled matchers,
+        so pattern setup is paid once for the whole batch.
+
+        Args:
+            configs: Template configurations to validate
+
+        Returns:
+            One SemanticValidationResult per configuration, in order
+        """
+        validate = self.validate
+        return [validate(config) for config in configs]
+
     def _check_role_definition(
         self, config: TemplateConfig, result: SemanticValidationResult
     ) -> None:
         """Check for clear role definition."""
-        system_content = config.system_prompt or ""
-        user_content = config.user_prompt or ""
-        template_content = config.template or ""
-
-        # Check system prompt for role
-        has_role_in_system = any(
-            p.search(system_content) for p in self._role_regex
+        # Check system prompt for role, falling back to the single template
+        # only when the system prompt has none
+        has_role = self._matches(
+            self._role_literals,
+            self._role_triggers,
+            self._role_regex,
+            config.system_prompt or "",
+        ) or self._matches(
+            self._role_literals,
+            self._role_triggers,
+            self._role_regex,
+            config.template or "",
         )
 
-        # Check if role is in user prompt (wrong place)
-        has_role_in_user = any(p.search(user_content) for p in self._role_regex)
-
-        # For single template, check there
-        has_role_in_template = any(
-            p.search(template_content) for p in self._role_regex
+        # Check if role is in user prompt (wrong place); only reported
+        # alongside a system prompt, so skip the scan otherwise
+        has_role_in_user = bool(config.system_prompt) and self._matches(
+            self._role_literals,
+            self._role_triggers,
+            self._role_regex,
+            config.user_prompt or "",
         )
 
-        has_role = has_role_in_system or has_role_in_template
-
         # Scoring
         if has_role:
             result.role_clarity_score = 100
@@ -193,7 +468,7 @@ class SemanticValidator:
                 )
             )
 
-        if has_role_in_user and config.system_prompt:
+        if has_role_in_user:
             result.role_clarity_score -= 20
             result.add_issue(
                 SemanticIssue(
@@ -206,26 +481,39 @@ class SemanticValidator:
             )
 
     def _check_instruction_clarity(
-        self, config: TemplateConfig, result: SemanticValidationResult
+        self,
+        config: TemplateConfig,
+        all_content: str,
+        content_folded: str,
+        result: SemanticValidationResult,
     ) -> None:
         """Check for clear instructions."""
-        all_content = (
-            (config.system_prompt or "")
-            + (config.user_prompt or "")
-            + (config.template or "")
-        )
-
         # Check for task patterns
-        has_task = any(p.search(all_content) for p in self._task_regex)
+        has_task = self._matches(
+            self._task_literals,
+            self._task_triggers,
+            self._task_regex,
+            all_content,
+            content_folded,
+        )
 
         # Check for output format
-        has_output_format = any(p.search(all_content) for p in self._output_regex)
-
-        # Check for ambiguous language
-        ambiguous_count = sum(
-            len(p.findall(all_content)) for p in self._ambiguous_regex
+        has_output_format = self._matches(
+            self._output_literals,
+            self._output_triggers,
+            self._output_regex,
+            all_content,
+            content_folded,
         )
 
+        # Check for ambiguous language, skipping the scan when no phrase
+        # can be present
+        triggers = self._ambiguous_triggers
+        if triggers is not None and not any(t in content_folded for t in triggers):
+            ambiguous_count = 0
+        else:
+            ambiguous_count = len(self._ambiguous_regex.findall(all_content))
+
         score = 100
 
         if not has_task:
@@ -274,20 +562,7 @@ class SemanticValidator:
 
         if config.system_prompt and config.user_prompt:
             # Check for repeated content (potential redundancy)
-            system_lower = config.system_prompt.lower()
-            user_lower = config.user_prompt.lower()
-
-            system_sentences = {
-                s.strip()
-                for s in system_lower.split(".")
-                if len(s.strip()) > 30
-            }
-            user_sentences = {
-                s.strip() for s in user_lower.split(".") if len(s.strip()) > 30
-            }
-
-            overlap = system_sentences & user_sentences
-            if overlap:
+            if _has_sentence_overlap(config.system_prompt, config.user_prompt):
                 score -= 15
                 result.add_issue(
                     SemanticIssue(
@@ -302,30 +577,32 @@ class SemanticValidator:
         result.context_coherence_score = max(0, score)
 
     def _check_task_alignment(
-        self, config: TemplateConfig, result: SemanticValidationResult
+        self,
+        config: TemplateConfig,
+        content_lower: str,
+        result: SemanticValidationResult,
     ) -> None:
         """Check if task description aligns with template structure."""
         score = 100
 
         desc_lower = config.description.lower() if config.description else ""
-        all_content = (
-            (config.system_prompt or "")
-            + (config.user_prompt or "")
-            + (config.template or "")
-        )
-        content_lower = all_content.lower()
 
         if desc_lower:
             # Extract key terms from description (words 4+ chars)
-            key_terms = set(re.findall(r"\b[a-z]{4,}\b", desc_lower))
-            content_terms = set(re.findall(r"\b[a-z]{4,}\b", content_lower))
+            key_terms = _extract_terms(desc_lower)
+            content_terms = _extract_terms(content_lower)
 
-            # Check overlap
+            # Check overlap, stopping once 30% of key terms are found
             if key_terms:
-                overlap = key_terms & content_terms
-                overlap_ratio = len(overlap) / len(key_terms)
-
-                if overlap_ratio < 0.3:
+                threshold = math.ceil(0.3 * len(key_terms))
+                hits = 0
+                for term in key_terms:
+                    if term in content_terms:
+                        hits += 1
+                        if hits >= threshold:
+                            break
+
+                if hits < threshold:
                     score -= 20
                     result.add_issue(
                         SemanticIssue(
@@ -351,47 +628,46 @@ class SemanticValidator:
         result.task_alignment_score = max(0, score)
 
     def _check_placeholder_quality(
-        self, config: TemplateConfig, result: SemanticValidationResult
+        self,
+        config: TemplateConfig,
+        all_content: str,
+        result: SemanticValidationResult,
     ) -> None:
         """Check quality of variable placeholders."""
-        all_content = (
-            (config.system_prompt or "")
-            + (config.user_prompt or "")
-            + (config.template or "")
-        )
-
-        # Find all variable usages
-        var_usages = re.findall(r"\{\{\s*(\w+)\s*\}\}", all_content)
-
-        for var_name in set(var_usages):
-            # Check if variable exists in config
-            var_config = config.get_variable(var_name)
-
-            if var_config:
-                # Find surrounding context for each usage
-                pattern = r".{0,20}\{\{\s*" + re.escape(var_name) + r"\s*\}\}.{0,20}"
-                matches = re.findall(pattern, all_content, re.DOTALL)
-
-                for match in matches:
-                    # Check if variable appears standalone without context
-                    stripped = match.strip()
-                    var_pattern = r"^\{\{\s*" + re.escape(var_name) + r"\s*\}\}$"
-                    if re.match(var_pattern, stripped):
-                        msg = f"Variable '{var_name}' appears without context"
-                        sug = f"Add context like '{var_name}: {{{{ {var_name} }}}}'"
-                        result.add_issue(
-                            SemanticIssue(
-                                type=SemanticIssueType.PLACEHOLDER_QUALITY,
-                                severity="info",
-                                message=msg,
-                                location="template",
-                                suggestion=sug,
-                            )
-                        )
-                        break  # Only report once per variable
+        reported: set[str] = set()
+        variables = config.get_variables_by_name()
+
+        # Single pass over all variable usages, inspecting nearby context
+        for match in _VAR_RE.finditer(all_content):
+            var_name = match.group(1)
+            if var_name in reported or var_name not in variables:
+                continue
+
+            # Check if variable appears standalone without context
+            start, end = match.span()
+            left = all_content[max(0, start - _CONTEXT_CHARS) : start]
+            right = all_content[end : end + _CONTEXT_CHARS]
+            if left.strip() or right.strip():
+                continue
+
+            reported.add(var_name)  # Only report once per variable
+            msg = f"Variable '{var_name}' appears without context"
+            sug = f"Add context like '{var_name}: {{{{ {var_name} }}}}'"
+            result.add_issue(
+                SemanticIssue(
+                    type=SemanticIssueType.PLACEHOLDER_QUALITY,
+                    severity="info",
+                    message=msg,
+                    location="template",
+                    suggestion=sug,
+                )
+            )
 
     def _check_prompt_structure(
-        self, config: TemplateConfig, result: SemanticValidationResult
+        self,
+        config: TemplateConfig,
+        all_content: str,
+        result: SemanticValidationResult,
     ) -> None:
         """Check overall prompt structure quality."""
         # Check for appropriate use of system_prompt vs user_prompt
@@ -407,12 +683,6 @@ class SemanticValidator:
             )
 
         # Check for very long single prompts without structure
-        all_content = (
-            (config.system_prompt or "")
-            + (config.user_prompt or "")
-            + (config.template or "")
-        )
-
         if len(all_content) > 3000 and not config.system_prompt:
             # Check if it has some structure
             has_structure = any(
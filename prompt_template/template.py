@@ -1,9 +1,11 @@
 """Core Template class for loading, validating, and rendering templates."""
 
+import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
+from jinja2 import Template as JinjaTemplate
 from jinja2 import TemplateSyntaxError, UndefinedError
 from pydantic import ValidationError
 
@@ -12,6 +14,24 @@ from .renderer import TemplateRenderer
 from .validator import TemplateValidator, ValidationResult
 
 
+@lru_cache(maxsize=1)
+def _yaml_loader() -> tuple[Any, bool]:
+    """Get the YAML loader class and whether it is backed by LibYAML.
+
+    PyYAML is imported on first use, so code that only builds templates
+    from dicts or JSON never pays for it. The LibYAML-backed loader is
+    preferred, falling back to pure Python if unavailable.
+    """
+    try:
+        from yaml import CSafeLoader
+
+        return CSafeLoader, True
+    except ImportError:
+        from yaml import SafeLoader
+
+        return SafeLoader, False
+
+
 class TemplateError(Exception):
     """Base exception for template errors."""
 
@@ -76,8 +96,12 @@ class Template:
             config: The template configuration
         """
         self.config = config
-        self._renderer = TemplateRenderer()
-        self._validator = TemplateValidator()
+        # Shared by all templates, so Jinja2 environments and compile caches
+        # are built once per process rather than once per template
+        self._validator = _shared_validator()
+        self._renderer = self._validator.renderer
+        # Compiled Jinja2 templates for this config, filled lazily on render
+        self._compiled: dict[str, JinjaTemplate] = {}
 
     @classmethod
     def from_file(cls, path: str | Path) -> "Template":
@@ -93,31 +117,60 @@ class Template:
             TemplateNotFoundError: If file doesn't exist
             TemplateValidationError: If file content is invalid
         """
+        # Parsed configs are shared by the cache, so each template gets a copy
+        return cls(cls._config_from_file(path).model_copy(deep=True))
+
+    @classmethod
+    def _config_from_file(cls, path: str | Path) -> TemplateConfig:
+        """Read and parse a template file into a config.
+
+        The result is shared with the parse cache and must not be modified.
+        """
         path = Path(path)
 
-        if not path.exists():
+        try:
+            # Raw bytes go straight to LibYAML, which decodes UTF-8 itself.
+            # Opening directly rather than checking exists() first saves a
+            # stat call per file.
+            content = path.read_bytes()
+        except FileNotFoundError:
             raise TemplateNotFoundError(
                 f"Template file not found: {path}",
                 suggestion="Check the file path and ensure the file exists",
                 context={"path": str(path.absolute())},
             )
-
-        try:
-            content = path.read_text(encoding="utf-8")
         except OSError as e:
             raise TemplateError(
                 f"Failed to read template file: {e}",
                 context={"path": str(path)},
             )
 
-        return cls.from_string(content, source=str(path))
+        return _cached_config(content, str(path), path.suffix == ".json")
 
     @classmethod
-    def from_string(cls, content: str, source: str = "<string>") -> "Template":
+    def _config_from_json(cls, content: str | bytes, source: str) -> TemplateConfig:
+        """Parse and validate JSON file content into a template config.
+
+        The stdlib JSON parser is much faster than a YAML loader, and JSON
+        files need none of YAML's extra syntax.
+        """
+        try:
+            data = json.loads(content)
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise TemplateValidationError(
+                f"Failed to parse JSON: {e}",
+                suggestion="Check JSON syntax",
+                context={"source": source},
+            )
+
+        return cls._from_parsed(data, source)
+
+    @classmethod
+    def from_string(cls, content: str | bytes, source: str = "<string>") -> "Template":
         """Load a template from a YAML/JSON string.
 
         Args:
-            content: YAML or JSON content
+            content: YAML or JSON content (bytes are decoded as UTF-8)
             source: Source identifier for error messages
 
         Returns:
@@ -126,8 +179,26 @@ class Template:
         Raises:
             TemplateValidationError: If content is invalid
         """
+        # Parsed configs are shared by the cache, so each template gets a copy
+        return cls(_cached_config(content, source).model_copy(deep=True))
+
+    @classmethod
+    def _config_from_string(cls, content: str | bytes, source: str) -> TemplateConfig:
+        """Parse and validate YAML/JSON content into a template config."""
+        import yaml
+
+        loader, has_libyaml = _yaml_loader()
         try:
-            data = yaml.safe_load(content)
+            if isinstance(content, bytes) and not has_libyaml:
+                # The pure-Python reader decodes bytes in small chunks
+                content = content.decode("utf-8")
+            data = yaml.load(content, Loader=loader)
+        except UnicodeDecodeError as e:
+            raise TemplateValidationError(
+                f"Failed to decode template as UTF-8: {e}",
+                suggestion="Save the template file with UTF-8 encoding",
+                context={"source": source},
+            )
         except yaml.YAMLError as e:
             raise TemplateValidationError(
                 f"Failed to parse YAML: {e}",
@@ -135,6 +206,11 @@ class Template:
                 context={"source": source},
             )
 
+        return cls._from_parsed(data, source)
+
+    @classmethod
+    def _from_parsed(cls, data: Any, source: str) -> TemplateConfig:
+        """Validate parsed file content, checking its shape."""
         if not isinstance(data, dict):
             raise TemplateValidationError(
                 "Template must be a YAML dictionary/object",
@@ -142,7 +218,7 @@ class Template:
                 context={"source": source, "got_type": type(data).__name__},
             )
 
-        return cls.from_dict(data, source=source)
+        return cls._config_from_dict(data, source)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any], source: str = "<dict>") -> "Template":
@@ -158,8 +234,13 @@ class Template:
         Raises:
             TemplateValidationError: If data is invalid
         """
+        return cls(cls._config_from_dict(data, source))
+
+    @staticmethod
+    def _config_from_dict(data: dict[str, Any], source: str) -> TemplateConfig:
+        """Validate a dictionary into a template config."""
         try:
-            config = TemplateConfig(**data)
+            return TemplateConfig(**data)
         except ValidationError as e:
             errors = []
             for err in e.errors():
@@ -171,8 +252,6 @@ class Template:
                 context={"source": source},
             )
 
-        return cls(config)
-
     @property
     def name(self) -> str:
         """Get the template name."""
@@ -193,13 +272,16 @@ class Template:
         """Get the raw template content."""
         return self.config.template
 
-    def validate(self) -> ValidationResult:
+    def validate(self, *, fast_fail: bool = False) -> ValidationResult:
         """Validate the template configuration.
 
+        Args:
+            fast_fail: Stop at the first validation pass that reports an error
+
         Returns:
             ValidationResult with errors and warnings
         """
-        return self._validator.validate(self.config)
+        return self._validator.validate(self.config, fast_fail=fast_fail)
 
     def render(self, **variables: Any) -> str:
         """Render the template with the given variables.
@@ -269,14 +351,20 @@ class Template:
             variables: Provided variable values
 
         Returns:
-            Variables with defaults applied
+            Variables with defaults applied; the given dict itself when
+            no defaults are missing
         """
-        merged = dict(variables)
-
+        # Read from the live config, which callers may edit in place; the
+        # first definition of a duplicated name wins
+        missing: dict[str, Any] = {}
         for var in self.config.variables:
-            if var.name not in merged and var.default is not None:
-                merged[var.name] = var.default
+            if var.default is not None and var.name not in variables:
+                missing.setdefault(var.name, var.default)
+        if not missing:
+            return variables
 
+        merged = dict(variables)
+        merged.update(missing)
         return merged
 
     def _validate_and_prepare(self, variables: dict[str, Any]) -> dict[str, Any]:
@@ -293,6 +381,7 @@ class Template:
         """
         merged_vars = self._apply_defaults(variables)
 
+        # Checked against the live config, which callers may edit in place
         validation = self._validator.validate_inputs(self.config, merged_vars)
         if not validation.is_valid:
             raise TemplateRenderError(
@@ -318,7 +407,15 @@ class Template:
             TemplateRenderError: If rendering fails
         """
         try:
-            return self._renderer.render(template_string, variables)
+            # Plain {{ name }} templates are filled in without Jinja2
+            rendered = self._renderer.render_simple(template_string, variables)
+            if rendered is not None:
+                return rendered
+            compiled = self._compiled.get(template_string)
+            if compiled is None:
+                compiled = self._renderer.compile(template_string)
+                self._compiled[template_string] = compiled
+            return self._renderer.render_compiled(compiled, variables)
         except TemplateSyntaxError as e:
             raise TemplateRenderError(
                 f"Template syntax error: {e.message}",
@@ -351,11 +448,7 @@ class Template:
         """
         # For preview, apply defaults but let the renderer show placeholders
         # for variables that are still missing
-        merged_vars = dict(variables)
-        # Apply defaults from config
-        for var in self.config.variables:
-            if var.name not in merged_vars and var.default is not None:
-                merged_vars[var.name] = var.default
+        merged_vars = self._apply_defaults(variables)
 
         # Handle split prompts the same way as render()
         if self.has_split_prompts:
@@ -408,3 +501,27 @@ class Template:
     def __repr__(self) -> str:
         """Return string representation."""
         return f"Template(name='{self.name}', variables={len(self.variables)})"
+
+
+@lru_cache(maxsize=128)
+def _cached_config(
+    content: str | bytes, source: str, is_json: bool = False
+) -> TemplateConfig:
+    """Parse template content, memoized so repeated loads skip parsing and validation.
+
+    The returned config is shared between callers and must be copied before
+    being handed to a Template.
+    """
+    if is_json:
+        return Template._config_from_json(content, source)
+    return Template._config_from_string(content, source)
+
+
+@lru_cache(maxsize=1)
+def _shared_validator() -> TemplateValidator:
+    """Get the validator, and through it the renderer, shared by all templates.
+
+    Created on first use so PROMPT_TEMPLATE_BYTECODE_CACHE can still be set
+    after import.
+    """
+    return TemplateValidator(TemplateRenderer())
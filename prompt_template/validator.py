@@ -33,12 +33,122 @@ class ValidationResult:
             self.is_valid = False
 
 
+def _is_int(v: Any) -> bool:
+    return isinstance(v, int) and not isinstance(v, bool)
+
+
+def _is_float(v: Any) -> bool:
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+
+# Value checks for each variable type. The bound __instancecheck__ methods
+# are isinstance() for a single class without a Python-level wrapper call.
+_TYPE_CHECKS: dict[VariableType, Callable[[Any], bool]] = {
+    VariableType.STRING: str.__instancecheck__,
+    VariableType.INTEGER: _is_int,
+    VariableType.FLOAT: _is_float,
+    VariableType.BOOLEAN: bool.__instancecheck__,
+    VariableType.LIST: list.__instancecheck__,
+    VariableType.OBJECT: dict.__instancecheck__,
+}
+
+
+def _type_error(name: str, value: Any, expected_type: VariableType) -> str:
+    """Format the error for a value that does not match its variable type."""
+    return (
+        f"Variable '{name}' has value of type {type(value).__name__}, "
+        f"expected {expected_type.value}"
+    )
+
+
+class _InputChecker:
+    """Validates input values against a template variable schema.
+
+    The schema is indexed once at construction, so each input value looks
+    up its variable by name instead of re-walking the configuration.
+    """
+
+    def __init__(self, config: TemplateConfig) -> None:
+        """Index the variable schema of a template configuration.
+
+        Args:
+            config: The template configuration
+        """
+        self._required = tuple(v.name for v in config.get_must_provide_variables())
+        self._specs: dict[
+            str, tuple[VariableType, Callable[[Any], bool] | None, list[Any] | None]
+        ] = {}
+        # Hashed copies of enums for O(1) membership tests
+        self._enum_sets: dict[str, frozenset[Any]] = {}
+        for name, var in config.get_variables_by_name().items():
+            self._specs[name] = (var.type, _TYPE_CHECKS.get(var.type), var.enum)
+            if var.enum is not None:
+                try:
+                    self._enum_sets[name] = frozenset(var.enum)
+                except TypeError:
+                    pass  # Unhashable enum values; fall back to the list
+
+    def __call__(self, inputs: dict[str, Any]) -> ValidationResult:
+        """Validate input values.
+
+        Args:
+            inputs: Dictionary of input values
+
+        Returns:
+            ValidationResult with input validation errors
+        """
+        result = ValidationResult(is_valid=True)
+
+        # Check required variables are provided (required=True AND no default)
+        for name in self._required:
+            if name not in inputs:
+                result.add_error(f"Missing required variable: '{name}'")
+
+        # Validate provided values
+        specs = self._specs
+        for name, value in inputs.items():
+            spec = specs.get(name)
+            if spec is None:
+                result.add_warning(f"Unknown variable provided: '{name}'")
+                continue
+
+            expected_type, check_fn, enum = spec
+
+            # Type validation
+            if check_fn is not None and not check_fn(value):
+                result.add_error(_type_error(name, value, expected_type))
+
+            # Enum validation
+            if enum is not None and not self._in_enum(name, value, enum):
+                result.add_error(
+                    f"Value '{value}' for variable '{name}' is not in "
+                    f"allowed values: {enum}"
+                )
+
+        return result
+
+    def _in_enum(self, name: str, value: Any, enum: list[Any]) -> bool:
+        """Check whether a value is one of a variable's allowed values."""
+        enum_set = self._enum_sets.get(name)
+        if enum_set is not None:
+            try:
+                return value in enum_set
+            except TypeError:
+                pass  # Unhashable value; compare against the list
+        return value in enum
+
+
 class TemplateValidator:
     """Validates template configuration and content."""
 
-    def __init__(self) -> None:
-        """Initialize the validator."""
-        self.renderer = TemplateRenderer()
+    def __init__(self, renderer: TemplateRenderer | None = None) -> None:
+        """Initialize the validator.
+
+        Args:
+            renderer: Renderer used for syntax checks. A new one is created
+                when not given.
+        """
+        self.renderer = renderer or TemplateRenderer()
 
     def _get_all_template_strings(
         self, config: TemplateConfig
@@ -74,33 +184,37 @@ class TemplateValidator:
             all_vars.update(self.renderer.extract_variables(template_string))
         return all_vars
 
-    def validate(self, config: TemplateConfig) -> ValidationResult:
+    def validate(
+        self, config: TemplateConfig, *, fast_fail: bool = False
+    ) -> ValidationResult:
         """Perform full validation on a template configuration.
 
         Args:
             config: The template configuration to validate
+            fast_fail: Return as soon as a validation pass reports an error,
+                for callers that only need the is_valid verdict
 
         Returns:
             ValidationResult with errors and warnings
         """
+        # All passes report into a single result
         result = ValidationResult(is_valid=True)
 
         # Validate syntax for all template strings
         for source_name, template_string in self._get_all_template_strings(config):
-            syntax_result = self.validate_syntax(template_string, source_name)
-            result.merge(syntax_result)
+            self._add_syntax_errors(template_string, source_name, result)
+        if fast_fail and not result.is_valid:
+            return result
 
         # Validate variables
-        var_result = self.validate_variables(config)
-        result.merge(var_result)
+        defined_vars = config.get_variable_names()
+        self._add_variable_errors(config, result, defined_vars)
+        if fast_fail and not result.is_valid:
+            return result
 
-        # Check for unused variables
-        unused_result = self.check_unused_variables(config)
-        result.merge(unused_result)
-
-        # Check for undeclared variables
-        undeclared_result = self.check_undeclared_variables(config)
-        result.merge(undeclared_result)
+        # Check for unused and undeclared variables in one pass
+        template_vars = self._extract_all_variables(config)
+        self._add_binding_warnings(defined_vars, template_vars, result)
 
         return result
 
@@ -117,7 +231,13 @@ class TemplateValidator:
             ValidationResult with syntax errors
         """
         result = ValidationResult(is_valid=True)
+        self._add_syntax_errors(template_string, source_name, result)
+        return result
 
+    def _add_syntax_errors(
+        self, template_string: str, source_name: str, result: ValidationResult
+    ) -> None:
+        """Add syntax errors for a template string to a result."""
         errors = self.renderer.validate_syntax(template_string)
         for error in errors:
             if source_name != "template":
@@ -125,8 +245,6 @@ class TemplateValidator:
             else:
                 result.add_error(error)
 
-        return result
-
     def validate_variables(self, config: TemplateConfig) -> ValidationResult:
         """Validate variable configurations.
 
@@ -137,20 +255,35 @@ class TemplateValidator:
             ValidationResult with variable errors
         """
         result = ValidationResult(is_valid=True)
+        self._add_variable_errors(config, result)
+        return result
+
+    def _add_variable_errors(
+        self,
+        config: TemplateConfig,
+        result: ValidationResult,
+        defined_vars: set[str] | None = None,
+    ) -> None:
+        """Add variable configuration errors to a result."""
+        if defined_vars is None:
+            defined_vars = config.get_variable_names()
+        # Names are unique unless the set is smaller than the list, so only
+        # then track which names have been seen
+        check_duplicates = len(defined_vars) != len(config.variables)
 
         seen_names: set[str] = set()
         for var in config.variables:
             # Check for duplicate variable names
-            if var.name in seen_names:
-                result.add_error(f"Duplicate variable name: '{var.name}'")
-            seen_names.add(var.name)
+            if check_duplicates:
+                if var.name in seen_names:
+                    result.add_error(f"Duplicate variable name: '{var.name}'")
+                seen_names.add(var.name)
 
             # Validate default value matches type
             if var.default is not None:
-                type_result = self._validate_value_type(
-                    var.name, var.default, var.type
-                )
-                result.merge(type_result)
+                check_fn = _TYPE_CHECKS.get(var.type)
+                if check_fn is not None and not check_fn(var.default):
+                    result.add_error(_type_error(var.name, var.default, var.type))
 
             # Validate default value is in enum if specified
             if var.enum and var.default is not None:
@@ -160,90 +293,76 @@ class TemplateValidator:
                         f"is not in enum: {var.enum}"
                     )
 
-        return result
-
-    def _validate_value_type(
-        self, name: str, value: Any, expected_type: VariableType
+    def check_unused_variables(
+        self, config: TemplateConfig, template_vars: set[str] | None = None
     ) -> ValidationResult:
-        """Validate a value matches the expected type.
-
-        Args:
-            name: Variable name (for error messages)
-            value: The value to validate
-            expected_type: Expected variable type
-
-        Returns:
-            ValidationResult with type errors
-        """
-        result = ValidationResult(is_valid=True)
-
-        def is_int(v: Any) -> bool:
-            return isinstance(v, int) and not isinstance(v, bool)
-
-        def is_float(v: Any) -> bool:
-            return isinstance(v, (int, float)) and not isinstance(v, bool)
-
-        type_checks: dict[VariableType, Callable[[Any], bool]] = {
-            VariableType.STRING: lambda v: isinstance(v, str),
-            VariableType.INTEGER: is_int,
-            VariableType.FLOAT: is_float,
-            VariableType.BOOLEAN: lambda v: isinstance(v, bool),
-            VariableType.LIST: lambda v: isinstance(v, list),
-            VariableType.OBJECT: lambda v: isinstance(v, dict),
-        }
-
-        check_fn = type_checks.get(expected_type)
-        if check_fn and not check_fn(value):
-            result.add_error(
-                f"Variable '{name}' has value of type {type(value).__name__}, "
-                f"expected {expected_type.value}"
-            )
-
-        return result
-
-    def check_unused_variables(self, config: TemplateConfig) -> ValidationResult:
         """Check for variables defined but not used in any template string.
 
         Args:
             config: The template configuration
+            template_vars: Variables used in the template strings, if already
+                extracted
 
         Returns:
             ValidationResult with warnings for unused variables
         """
+        if template_vars is None:
+            template_vars = self._extract_all_variables(config)
         result = ValidationResult(is_valid=True)
-
-        template_vars = self._extract_all_variables(config)
-        defined_vars = {v.name for v in config.variables}
-
-        unused = defined_vars - template_vars
-        for var_name in unused:
-            result.add_warning(
-                f"Variable '{var_name}' is defined but not used in template"
-            )
-
+        self._add_binding_warnings(
+            config.get_variable_names(), template_vars, result, undeclared=False
+        )
         return result
 
-    def check_undeclared_variables(self, config: TemplateConfig) -> ValidationResult:
+    def check_undeclared_variables(
+        self, config: TemplateConfig, template_vars: set[str] | None = None
+    ) -> ValidationResult:
         """Check for variables used in any template string but not defined.
 
         Args:
             config: The template configuration
+            template_vars: Variables used in the template strings, if already
+                extracted
 
         Returns:
             ValidationResult with errors for undeclared variables
         """
+        if template_vars is None:
+            template_vars = self._extract_all_variables(config)
         result = ValidationResult(is_valid=True)
+        self._add_binding_warnings(
+            config.get_variable_names(), template_vars, result, unused=False
+        )
+        return result
 
-        template_vars = self._extract_all_variables(config)
-        defined_vars = {v.name for v in config.variables}
+    def _add_binding_warnings(
+        self,
+        defined_vars: set[str],
+        template_vars: set[str],
+        result: ValidationResult,
+        unused: bool = True,
+        undeclared: bool = True,
+    ) -> None:
+        """Compare defined variables against those used in the templates.
 
-        undeclared = template_vars - defined_vars
-        for var_name in undeclared:
-            result.add_warning(
-                f"Variable '{var_name}' is used in template but not declared"
-            )
+        Args:
+            defined_vars: Names of the variables defined in the configuration
+            template_vars: Variables used in the template strings
+            result: Result to add warnings to
+            unused: Whether to warn about defined but unused variables
+            undeclared: Whether to warn about used but undeclared variables
+        """
+        if unused:
+            for var_name in defined_vars - template_vars:
+                result.add_warning(
+                    f"Variable '{var_name}' is defined but not used in template"
+                )
 
-        return result
+        if undeclared:
+            for var_name in template_vars - defined_vars:
+                result.add_warning(
+                    f"Variable '{var_name}' is used in template but not declared"
+                )
 
     def validate_inputs(
         self, config: TemplateConfig, inputs: dict[str, Any]
@@ -257,29 +376,4 @@ class TemplateValidator:
         Returns:
             ValidationResult with input validation errors
         """
-        result = ValidationResult(is_valid=True)
-
-        # Check required variables are provided (required=True AND no default)
-        for var in config.get_must_provide_variables():
-            if var.name not in inputs:
-                result.add_error(f"Missing required variable: '{var.name}'")
-
-        # Validate provided values
-        for name, value in inputs.items():
-            var_config = config.get_variable(name)
-            if var_config is None:
-                result.add_warning(f"Unknown variable provided: '{name}'")
-                continue
-
-            # Type validation
-            type_result = self._validate_value_type(name, value, var_config.type)
-            result.merge(type_result)
-
-            # Enum validation
-            if var_config.enum is not None and value not in var_config.enum:
-                result.add_error(
-                    f"Value '{value}' for variable '{name}' is not in "
-                    f"allowed values: {var_config.enum}"
-                )
-
-        return result
+        return _InputChecker(config)(inputs)
@@ -1,7 +1,6 @@
 """Tests for the CLI interface."""
 
-import shutil
-import tempfile
+import re
 from pathlib import Path
 
 import pytest
@@ -9,22 +8,17 @@ from click.testing import CliRunner
 
 from prompt_template.cli import cli
 
+# Template files shared by several tests, pre-encoded for write_bytes
+ECHO_CONTENT_YAML = b"""
+name: echo
+template: "{{content}}"
+variables:
+  - name: content
+    type: string
+    required: true
+"""
 
-class TestCLI:
-    """Tests for CLI commands."""
-
-    @pytest.fixture
-    def runner(self):
-        """Create a CLI runner."""
-        return CliRunner()
-
-    @pytest.fixture
-    def temp_templates_dir(self):
-        """Create a temporary directory with test templates."""
-        temp_dir = Path(tempfile.mkdtemp())
-
-        # Create test template
-        template_content = """
+TEST_TEMPLATE_YAML = b"""
 name: test-template
 description: A test template for CLI testing
 version: 1.0.0
@@ -43,20 +37,69 @@ variables:
     default: blue
     description: Your favorite color
 """
-        templates_dir = temp_dir / "templates"
-        templates_dir.mkdir()
-        (templates_dir / "test-template.yaml").write_text(template_content)
 
-        # Change to temp directory for tests
-        original_cwd = Path.cwd()
-        import os
-        os.chdir(temp_dir)
+GREETING_YAML = b"""
+name: echo
+template: "Hello, {{name}}!"
+variables:
+  - name: name
+    type: string
+    required: true
+"""
+
+TEST_YAML = b"""
+name: test
+template: "{{x}}"
+variables:
+  - name: x
+    type: string
+    required: true
+"""
+
+CHAT_YAML = b"""
+name: chat
+system_prompt: "You are a helpful {{role}}."
+user_prompt: "Please help me with: {{task}}"
+variables:
+  - name: role
+    type: string
+    required: true
+  - name: task
+    type: string
+    required: true
+"""
+
+# Matches the error shown when required variables are not provided
+_MISSING_RE = re.compile(r"missing|required", re.IGNORECASE)
+
+# Command prefixes for running the test templates
+ECHO_RUN = ("run", "echo")
+TEST_RUN = ("run", "test-template")
+CHAT_RUN = ("run", "chat")
+
+
+@pytest.fixture(scope="module")
+def runner():
+    """Create a CLI runner shared by the tests in this module."""
+    return CliRunner()
+
+
+@pytest.fixture
+def iso_fs(tmp_path, monkeypatch):
+    """Change into a fresh directory with an empty templates/ folder."""
+    (tmp_path / "templates").mkdir()
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
 
-        yield temp_dir
+class TestCLI:
+    """Tests for CLI commands."""
 
-        # Restore and cleanup
-        os.chdir(original_cwd)
-        shutil.rmtree(temp_dir)
+    @pytest.fixture
+    def temp_templates_dir(self, iso_fs):
+        """Create a temporary directory with test templates."""
+        (iso_fs / "templates" / "test-template.yaml").write_bytes(TEST_TEMPLATE_YAML)
+        return iso_fs
 
     def test_version(self, runner):
         """Test --version flag."""
@@ -75,12 +118,14 @@ variables:
         assert "show" in result.output
         assert "run" in result.output
 
-    def test_list_empty(self, runner):
+    def test_list_empty(self, runner, tmp_path, monkeypatch):
         """Test list command with no templates."""
-        with runner.isolated_filesystem():
-            result = runner.invoke(cli, ["list"])
+        monkeypatch.chdir(tmp_path)
 
-            assert "No templates found" in result.output
+        result = runner.invoke(cli, ["list"])
+
+        assert result.exit_code == 0
+        assert "No templates found" in result.output
 
     def test_list_templates(self, runner, temp_templates_dir):
         """Test list command with templates."""
@@ -118,6 +163,8 @@ variables:
 
         assert result.exit_code == 0
         assert "template:" in result.output
+        assert "type: string" in result.output
+        assert "!!python" not in result.output
 
     def test_show_template_preview(self, runner, temp_templates_dir):
         """Test show --preview command."""
@@ -136,7 +183,7 @@ variables:
 
     def test_run_template(self, runner, temp_templates_dir):
         """Test run command with variables."""
-        result = runner.invoke(cli, ["run", "test-template", "-v", "name=Alice"])
+        result = runner.invoke(cli, [*TEST_RUN, "-v", "name=Alice"])
 
         assert result.exit_code == 0
         assert "Hello, Alice!" in result.output
@@ -145,7 +192,7 @@ variables:
     def test_run_template_override_default(self, runner, temp_templates_dir):
         """Test run command overriding default value."""
         result = runner.invoke(cli, [
-            "run", "test-template",
+            *TEST_RUN,
             "-v", "name=Bob",
             "-v", "color=red"
         ])
@@ -156,19 +203,28 @@ variables:
 
     def test_run_missing_required(self, runner, temp_templates_dir):
         """Test run command with missing required variable."""
-        result = runner.invoke(cli, ["run", "test-template"])
+        result = runner.invoke(cli, [*TEST_RUN])
 
         assert result.exit_code == 1
-        assert "missing" in result.output.lower() or "required" in result.output.lower()
+        assert _MISSING_RE.search(result.output)
 
     def test_run_interactive(self, runner, temp_templates_dir):
         """Test run command in interactive mode."""
         result = runner.invoke(cli, [
-            "run", "test-template", "-i"
+            *TEST_RUN, "-i"
         ], input="Alice\n")
 
         assert result.exit_code == 0
-        assert "Alice" in result.output
+        assert "Hello, Alice!" in result.output
+
+    def test_run_interactive_with_provided_values(self, runner, temp_templates_dir):
+        """Test interactive mode does not prompt for provided variables."""
+        result = runner.invoke(cli, [*TEST_RUN, "-i", "-v", "name=Alice", "-f", "raw"])
+
+        assert result.exit_code == 0
+        assert result.output.strip() == (
+            "Hello, Alice! Your favorite color is blue."
+        )
 
     def test_validate_valid_template(self, runner, temp_templates_dir):
         """Test validate command with valid template."""
@@ -196,21 +252,23 @@ variables:
         assert result.exit_code == 1
         assert "error" in result.output.lower()
 
-    def test_init_creates_directory(self, runner):
+    def test_init_creates_directory(self, runner, tmp_path, monkeypatch):
         """Test init command creates directory."""
-        with runner.isolated_filesystem():
-            result = runner.invoke(cli, ["init", "--with-examples"])
+        monkeypatch.chdir(tmp_path)
+
+        result = runner.invoke(cli, ["init", "--with-examples"])
 
-            assert result.exit_code == 0
-            assert Path("templates").exists()
+        assert result.exit_code == 0
+        assert Path("templates").exists()
 
-    def test_init_with_custom_path(self, runner):
+    def test_init_with_custom_path(self, runner, tmp_path, monkeypatch):
         """Test init command with custom path."""
-        with runner.isolated_filesystem():
-            result = runner.invoke(cli, ["init", "-p", "my-prompts", "--with-examples"])
+        monkeypatch.chdir(tmp_path)
 
-            assert result.exit_code == 0
-            assert Path("my-prompts").exists()
+        result = runner.invoke(cli, ["init", "-p", "my-prompts", "--with-examples"])
+
+        assert result.exit_code == 0
+        assert Path("my-prompts").exists()
 
     def test_new_template(self, runner, temp_templates_dir):
         """Test new command creates template."""
@@ -241,277 +299,161 @@ variables:
 class TestCLIErrors:
     """Tests for CLI error handling."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_invalid_var_format(self, runner):
+    def test_invalid_var_format(self, runner, iso_fs):
         """Test error for invalid variable format."""
-        with runner.isolated_filesystem():
-            # Create minimal template
-            Path("templates").mkdir()
-            Path("templates/test.yaml").write_text("""
-name: test
-template: "{{x}}"
-variables:
-  - name: x
-    type: string
-    required: true
-""")
+        Path("templates/test.yaml").write_bytes(TEST_YAML)
 
-            result = runner.invoke(cli, ["run", "test", "-v", "invalid"])
+        result = runner.invoke(cli, ["run", "test", "-v", "invalid"])
 
-            assert result.exit_code == 1
-            is_invalid = "invalid" in result.output.lower()
-            is_format = "format" in result.output.lower()
-            assert is_invalid or is_format
+        assert result.exit_code == 1
+        is_invalid = "invalid" in result.output.lower()
+        is_format = "format" in result.output.lower()
+        assert is_invalid or is_format
 
-    def test_json_parse_error(self, runner):
+    def test_json_parse_error(self, runner, iso_fs):
         """Test error for invalid JSON input."""
-        with runner.isolated_filesystem():
-            Path("templates").mkdir()
-            Path("templates/test.yaml").write_text("""
-name: test
-template: "{{x}}"
-variables:
-  - name: x
-    type: string
-    required: true
-""")
-            Path("bad.json").write_text("{invalid json}")
+        Path("templates/test.yaml").write_bytes(TEST_YAML)
+        Path("bad.json").write_text("{invalid json}")
 
-            result = runner.invoke(cli, ["run", "test", "-j", "bad.json"])
+        result = runner.invoke(cli, ["run", "test", "-j", "bad.json"])
 
-            assert result.exit_code == 1
-            assert "json" in result.output.lower() or "parse" in result.output.lower()
+        assert result.exit_code == 1
+        assert "json" in result.output.lower() or "parse" in result.output.lower()
 
 
 class TestFileInput:
     """Tests for file input with @ prefix."""
 
     @pytest.fixture
-    def runner(self):
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_file_input_single(self, runner):
-        """Test loading single file with @ prefix."""
-        with runner.isolated_filesystem():
-            # Create template
-            Path("templates").mkdir()
-            Path("templates/echo.yaml").write_text("""
-name: echo
-template: "Content: {{text}}"
-variables:
-  - name: text
-    type: string
-    required: true
-""")
-            # Create test file
-            Path("input.txt").write_text("Hello from file!")
-
-            result = runner.invoke(cli, ["run", "echo", "-v", "text=@input.txt"])
-
-            assert result.exit_code == 0
-            assert "Hello from file!" in result.output
-
-    def test_file_input_glob_single_match(self, runner):
-        """Test glob pattern matching single file."""
-        with runner.isolated_filesystem():
-            Path("templates").mkdir()
-            Path("templates/echo.yaml").write_text("""
-name: echo
-template: "{{content}}"
-variables:
-  - name: content
-    type: string
-    required: true
-""")
-            Path("src").mkdir()
-            Path("src/main.py").write_text("print('hello')")
-
-            result = runner.invoke(cli, ["run", "echo", "-v", "content=@src/*.py"])
-
-            assert result.exit_code == 0
-            assert "print('hello')" in result.output
-
-    def test_file_input_glob_multiple_files(self, runner):
-        """Test glob pattern matching multiple files."""
-        with runner.isolated_filesystem():
-            Path("templates").mkdir()
-            Path("templates/echo.yaml").write_text("""
-name: echo
-template: "Files:\\n{{files}}"
-variables:
-  - name: files
-    type: string
-    required: true
-""")
-            Path("src").mkdir()
-            Path("src/a.py").write_text("# file a")
-            Path("src/b.py").write_text("# file b")
-
-            result = runner.invoke(cli, ["run", "echo", "-v", "files=@src/*.py"])
-
-            assert result.exit_code == 0
-            assert "# file a" in result.output
-            assert "# file b" in result.output
-            assert "# File:" in result.output  # Header for multiple files
-
-    def test_file_input_recursive_glob(self, runner):
-        """Test recursive glob pattern."""
-        with runner.isolated_filesystem():
-            Path("templates").mkdir()
-            Path("templates/echo.yaml").write_text("""
-name: echo
-template: "{{content}}"
-variables:
-  - name: content
-    type: string
-    required: true
-""")
-            Path("src/sub").mkdir(parents=True)
-            Path("src/main.py").write_text("# root")
-            Path("src/sub/util.py").write_text("# nested")
-
-            result = runner.invoke(cli, ["run", "echo", "-v", "content=@src/**/*.py"])
-
-            assert result.exit_code == 0
-            assert "# root" in result.output
-            assert "# nested" in result.output
-
-    def test_file_not_found(self, runner):
-        """Test error when file doesn't exist."""
-        with runner.isolated_filesystem():
-            Path("templates").mkdir()
-            Path("templates/echo.yaml").write_text("""
-name: echo
-template: "{{text}}"
-variables:
-  - name: text
-    type: string
-    required: true
-""")
-
-            result = runner.invoke(cli, ["run", "echo", "-v", "text=@nonexistent.txt"])
-
-            assert result.exit_code != 0
-            assert "File not found" in result.output
-
-    def test_glob_no_matches(self, runner):
-        """Test error when glob pattern matches no files."""
-        with runner.isolated_filesystem():
-            Path("templates").mkdir()
-            Path("templates/echo.yaml").write_text("""
-name: echo
-template: "{{text}}"
-variables:
-  - name: text
-    type: string
-    required: true
-""")
-            Path("src").mkdir()
-
-            result = runner.invoke(cli, ["run", "echo", "-v", "text=@src/*.xyz"])
-
-            assert result.exit_code != 0
-            assert "No files match pattern" in result.output
-
-    def test_file_input_with_equals_in_content(self, runner):
-        """Test file content containing equals signs."""
-        with runner.isolated_filesystem():
-            Path("templates").mkdir()
-            Path("templates/echo.yaml").write_text("""
-name: echo
-template: "{{content}}"
-variables:
-  - name: content
-    type: string
-    required: true
-""")
-            Path("config.txt").write_text("key=value\nfoo=bar")
-
-            result = runner.invoke(cli, ["run", "echo", "-v", "content=@config.txt"])
+    def workspace(self, iso_fs):
+        """Create a working directory with the echo template."""
+        (iso_fs / "templates" / "echo.yaml").write_bytes(ECHO_CONTENT_YAML)
+        return iso_fs
+
+    @pytest.mark.parametrize(
+        ("files", "value", "expected"),
+        [
+            pytest.param(
+                {"input.txt": "Hello from file!"},
+                "content=@input.txt",
+                ["Hello from file!"],
+                id="single-file",
+            ),
+            pytest.param(
+                {"src/main.py": "print('hello')"},
+                "content=@src/*.py",
+                ["print('hello')"],
+                id="glob-single-match",
+            ),
+            pytest.param(
+                {"src/a.py": "# file a", "src/b.py": "# file b"},
+                "content=@src/*.py",
+                # Multiple matches get a header per file
+                ["# file a", "# file b", "# File:"],
+                id="glob-multiple-files",
+            ),
+            pytest.param(
+                {"src/main.py": "# root", "src/sub/util.py": "# nested"},
+                "content=@src/**/*.py",
+                ["# root", "# nested"],
+                id="recursive-glob",
+            ),
+            pytest.param(
+                {"config.txt": "key=value\nfoo=bar"},
+                "content=@config.txt",
+                ["key=value", "foo=bar"],
+                id="equals-in-content",
+            ),
+            pytest.param(
+                # @ only triggers a file load at the start of the value
+                {},
+                "content=user@example.com",
+                ["user@example.com"],
+                id="literal-at-sign",
+            ),
+        ],
+    )
+    def test_file_input(self, runner, workspace, files, value, expected):
+        """Test loading variable values from files with the @ prefix."""
+        for name, content in files.items():
+            path = workspace / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+
+        result = runner.invoke(cli, [*ECHO_RUN, "-v", value])
 
-            assert result.exit_code == 0
-            assert "key=value" in result.output
-            assert "foo=bar" in result.output
-
-    def test_file_input_mixed_with_literal(self, runner):
-        """Test mixing file input with literal values."""
-        with runner.isolated_filesystem():
-            Path("templates").mkdir()
-            Path("templates/review.yaml").write_text("""
+        assert result.exit_code == 0
+        for fragment in expected:
+            assert fragment in result.output
+
+    @pytest.mark.parametrize(
+        ("value", "message"),
+        [
+            pytest.param(
+                "content=@nonexistent.txt", "File not found", id="file-not-found"
+            ),
+            pytest.param(
+                "content=@src/*.xyz", "No files match pattern", id="glob-no-matches"
+            ),
+        ],
+    )
+    def test_file_input_errors(self, runner, workspace, value, message):
+        """Test errors for file inputs that match nothing."""
+        (workspace / "src").mkdir()
+
+        result = runner.invoke(cli, [*ECHO_RUN, "-v", value])
+
+        assert result.exit_code != 0
+        assert message in result.output
+
+    def test_file_input_mixed_with_literal(self, runner, workspace):
+        """Test mixing file, glob, and literal values in one invocation."""
+        (workspace / "templates" / "review.yaml").write_text("""
 name: review
-template: "Language: {{lang}}\\nCode:\\n{{code}}"
+template: "Language: {{lang}}\\nNotes: {{notes}}\\nCode:\\n{{code}}"
 variables:
   - name: code
     type: string
     required: true
-  - name: lang
+  - name: notes
     type: string
     required: true
-""")
-            Path("main.py").write_text("print('hello')")
-
-            result = runner.invoke(cli, [
-                "run", "review",
-                "-v", "code=@main.py",
-                "-v", "lang=python"
-            ])
-
-            assert result.exit_code == 0
-            assert "Language: python" in result.output
-            assert "print('hello')" in result.output
-
-    def test_literal_at_sign(self, runner):
-        """Test that @ at beginning triggers file load, not in middle."""
-        with runner.isolated_filesystem():
-            Path("templates").mkdir()
-            Path("templates/echo.yaml").write_text("""
-name: echo
-template: "{{text}}"
-variables:
-  - name: text
+  - name: lang
     type: string
     required: true
 """)
+        (workspace / "notes.txt").write_text("check errors")
+        (workspace / "src").mkdir()
+        (workspace / "src" / "a.py").write_text("print('a')")
+        (workspace / "src" / "b.py").write_text("print('b')")
 
-            # Email address should be passed literally (@ not at start after =)
-            result = runner.invoke(cli, ["run", "echo", "-v", "text=user@example.com"])
+        result = runner.invoke(cli, [
+            "run", "review",
+            "-v", "code=@src/*.py",
+            "-v", "notes=@notes.txt",
+            "-v", "lang=python",
+        ])
 
-            assert result.exit_code == 0
-            assert "user@example.com" in result.output
+        assert result.exit_code == 0
+        assert "Language: python" in result.output
+        assert "Notes: check errors" in result.output
+        assert "print('a')" in result.output
+        assert "print('b')" in result.output
 
 
 class TestOutputFormats:
     """Tests for output format options."""
 
     @pytest.fixture
-    def runner(self):
-        """Create a CLI runner."""
-        return CliRunner()
-
-    @pytest.fixture
-    def template_dir(self, runner):
+    def template_dir(self, iso_fs):
         """Create a temporary directory with a test template."""
-        with runner.isolated_filesystem():
-            Path("templates").mkdir()
-            Path("templates/echo.yaml").write_text("""
-name: echo
-template: "Hello, {{name}}!"
-variables:
-  - name: name
-    type: string
-    required: true
-""")
-            yield
+        (iso_fs / "templates" / "echo.yaml").write_bytes(GREETING_YAML)
+        return iso_fs
 
     def test_format_raw(self, runner, template_dir):
         """Test raw output format."""
         result = runner.invoke(cli, [
-            "run", "echo", "-v", "name=World", "-f", "raw"
+            *ECHO_RUN, "-v", "name=World", "-f", "raw"
         ])
 
         assert result.exit_code == 0
@@ -525,63 +467,72 @@ variables:
         import json
 
         result = runner.invoke(cli, [
-            "run", "echo", "-v", "name=World", "-f", "json"
+            *ECHO_RUN, "-v", "name=World", "-f", "json"
         ])
 
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = json.loads(result.stdout_bytes)
         assert data["template"]["name"] == "echo"
         assert data["rendered"] == "Hello, World!"
         assert data["variables"]["name"] == "World"
         assert "timestamp" in data["metadata"]
 
-    def test_format_markdown(self, runner, template_dir):
-        """Test Markdown output format."""
-        result = runner.invoke(cli, [
-            "run", "echo", "-v", "name=World", "-f", "markdown"
-        ])
-
-        assert result.exit_code == 0
-        assert "# echo" in result.output
-        assert "**Version:**" in result.output
-        assert "## Variables" in result.output
-        assert "| name | World |" in result.output
-        assert "## Rendered Output" in result.output
-        assert "Hello, World!" in result.output
-
     def test_format_chat_api(self, runner, template_dir):
         """Test chat-api output format."""
         import json
 
         result = runner.invoke(cli, [
-            "run", "echo", "-v", "name=World", "-f", "chat-api"
+            *ECHO_RUN, "-v", "name=World", "-f", "chat-api"
         ])
 
         assert result.exit_code == 0
-        data = json.loads(result.output)
+        data = json.loads(result.stdout_bytes)
         assert "messages" in data
         assert len(data["messages"]) == 1
         assert data["messages"][0]["role"] == "user"
         assert data["messages"][0]["content"] == "Hello, World!"
         assert data["metadata"]["template"] == "echo"
 
-    def test_format_env(self, runner, template_dir):
-        """Test env output format."""
+    @pytest.mark.parametrize(
+        ("fmt", "expected"),
+        [
+            (
+                "markdown",
+                [
+                    "# echo",
+                    "**Version:**",
+                    "## Variables",
+                    "| name | World |",
+                    "## Rendered Output",
+                    "Hello, World!",
+                ],
+            ),
+            (
+                "env",
+                [
+                    "#!/bin/bash",
+                    'export PROMPT_TEMPLATE_NAME="echo"',
+                    "export PROMPT_VAR_NAME='World'",
+                    "PROMPT_CONTENT",
+                    "Hello, World!",
+                ],
+            ),
+        ],
+    )
+    def test_format_text(self, runner, template_dir, fmt, expected):
+        """Test text output formats contain their expected sections."""
         result = runner.invoke(cli, [
-            "run", "echo", "-v", "name=World", "-f", "env"
+            *ECHO_RUN, "-v", "name=World", "-f", fmt
         ])
 
         assert result.exit_code == 0
-        assert "#!/bin/bash" in result.output
-        assert 'export PROMPT_TEMPLATE_NAME="echo"' in result.output
-        assert "export PROMPT_VAR_NAME='World'" in result.output
-        assert "PROMPT_CONTENT" in result.output
-        assert "Hello, World!" in result.output
+        for fragment in expected:
+            assert fragment in result.output
 
     def test_output_to_file(self, runner, template_dir):
         """Test writing output to file."""
         result = runner.invoke(cli, [
-            "run", "echo", "-v", "name=World", "-f", "raw", "-o", "output.txt"
+            *ECHO_RUN, "-v", "name=World", "-f", "raw", "-o", "output.txt"
         ])
 
         assert result.exit_code == 0
@@ -594,139 +545,82 @@ variables:
         import json
 
         result = runner.invoke(cli, [
-            "run", "echo", "-v", "name=World", "-f", "json", "-o", "output.json"
+            *ECHO_RUN, "-v", "name=World", "-f", "json", "-o", "output.json"
         ])
 
         assert result.exit_code == 0
-        data = json.loads(Path("output.json").read_text())
+        data = json.loads(Path("output.json").read_bytes())
         assert data["rendered"] == "Hello, World!"
 
 
 class TestSplitPrompts:
     """Tests for system/user prompt separation."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create a CLI runner."""
-        return CliRunner()
-
-    def test_split_prompts_render(self, runner):
+    def test_split_prompts_render(self, runner, iso_fs):
         """Test rendering with split system/user prompts."""
-        with runner.isolated_filesystem():
-            Path("templates").mkdir()
-            Path("templates/chat.yaml").write_text("""
-name: chat
-system_prompt: "You are a helpful {{role}}."
-user_prompt: "Please help me with: {{task}}"
-variables:
-  - name: role
-    type: string
-    required: true
-  - name: task
-    type: string
-    required: true
-""")
+        Path("templates/chat.yaml").write_bytes(CHAT_YAML)
 
-            result = runner.invoke(cli, [
-                "run", "chat", "-v", "role=assistant", "-v", "task=coding"
-            ])
+        result = runner.invoke(cli, [
+            *CHAT_RUN, "-v", "role=assistant", "-v", "task=coding"
+        ])
 
-            assert result.exit_code == 0
-            assert "You are a helpful assistant." in result.output
-            assert "Please help me with: coding" in result.output
+        assert result.exit_code == 0
+        assert "You are a helpful assistant." in result.output
+        assert "Please help me with: coding" in result.output
 
-    def test_split_prompts_json_format(self, runner):
+    def test_split_prompts_json_format(self, runner, iso_fs):
         """Test JSON output includes split prompts."""
         import json
 
-        with runner.isolated_filesystem():
-            Path("templates").mkdir()
-            Path("templates/chat.yaml").write_text("""
-name: chat
-system_prompt: "You are a helpful {{role}}."
-user_prompt: "Please help me with: {{task}}"
-variables:
-  - name: role
-    type: string
-    required: true
-  - name: task
-    type: string
-    required: true
-""")
+        Path("templates/chat.yaml").write_bytes(CHAT_YAML)
 
-            result = runner.invoke(cli, [
-                "run", "chat",
-                "-v", "role=assistant",
-                "-v", "task=coding",
-                "-f", "json"
-            ])
+        result = runner.invoke(cli, [
+            *CHAT_RUN,
+            "-v", "role=assistant",
+            "-v", "task=coding",
+            "-f", "json"
+        ])
 
-            assert result.exit_code == 0
-            data = json.loads(result.output)
-            assert "prompts" in data
-            assert data["prompts"]["system"] == "You are a helpful assistant."
-            assert data["prompts"]["user"] == "Please help me with: coding"
+        assert result.exit_code == 0
+        data = json.loads(result.stdout_bytes)
+        assert "prompts" in data
+        assert data["prompts"]["system"] == "You are a helpful assistant."
+        assert data["prompts"]["user"] == "Please help me with: coding"
 
-    def test_split_prompts_chat_api_format(self, runner):
+    def test_split_prompts_chat_api_format(self, runner, iso_fs):
         """Test chat-api output with split prompts."""
         import json
 
-        with runner.isolated_filesystem():
-            Path("templates").mkdir()
-            Path("templates/chat.yaml").write_text("""
-name: chat
-system_prompt: "You are a helpful {{role}}."
-user_prompt: "Please help me with: {{task}}"
-variables:
-  - name: role
-    type: string
-    required: true
-  - name: task
-    type: string
-    required: true
-""")
+        Path("templates/chat.yaml").write_bytes(CHAT_YAML)
 
-            result = runner.invoke(cli, [
-                "run", "chat",
-                "-v", "role=assistant",
-                "-v", "task=coding",
-                "-f", "chat-api"
-            ])
-
-            assert result.exit_code == 0
-            data = json.loads(result.output)
-            assert len(data["messages"]) == 2
-            assert data["messages"][0]["role"] == "system"
-            assert data["messages"][0]["content"] == "You are a helpful assistant."
-            assert data["messages"][1]["role"] == "user"
-            assert data["messages"][1]["content"] == "Please help me with: coding"
-
-    def test_split_prompts_markdown_format(self, runner):
+        result = runner.invoke(cli, [
+            *CHAT_RUN,
+            "-v", "role=assistant",
+            "-v", "task=coding",
+            "-f", "chat-api"
+        ])
+
+        assert result.exit_code == 0
+        data = json.loads(result.stdout_bytes)
+        assert len(data["messages"]) == 2
+        assert data["messages"][0]["role"] == "system"
+        assert data["messages"][0]["content"] == "You are a helpful assistant."
+        assert data["messages"][1]["role"] == "user"
+        assert data["messages"][1]["content"] == "Please help me with: coding"
+
+    def test_split_prompts_markdown_format(self, runner, iso_fs):
         """Test markdown output with split prompts."""
-        with runner.isolated_filesystem():
-            Path("templates").mkdir()
-            Path("templates/chat.yaml").write_text("""
-name: chat
-system_prompt: "You are a helpful {{role}}."
-user_prompt: "Please help me with: {{task}}"
-variables:
-  - name: role
-    type: string
-    required: true
-  - name: task
-    type: string
-    required: true
-""")
+        Path("templates/chat.yaml").write_bytes(CHAT_YAML)
 
-            result = runner.invoke(cli, [
-                "run", "chat",
-                "-v", "role=assistant",
-                "-v", "task=coding",
-                "-f", "markdown"
-            ])
-
-            assert result.exit_code == 0
-            assert "## System Prompt" in result.output
-            assert "## User Prompt" in result.output
-            assert "You are a helpful assistant." in result.output
-            assert "Please help me with: coding" in result.output
+        result = runner.invoke(cli, [
+            *CHAT_RUN,
+            "-v", "role=assistant",
+            "-v", "task=coding",
+            "-f", "markdown"
+        ])
+
+        assert result.exit_code == 0
+        assert "## System Prompt" in result.output
+        assert "## User Prompt" in result.output
+        assert "You are a helpful assistant." in result.output
+        assert "Please help me with: coding" in result.output
@@ -1,7 +1,11 @@
 """Tests for quality scoring."""
 
+import pickle
+from dataclasses import asdict
 
-from prompt_template import Template
+import pytest
+
+from prompt_template import Template, TokenCounter
 from prompt_template.quality import (
     DimensionScore,
     QualityDimension,
@@ -167,6 +171,14 @@ class TestQualityScorer:
         assert QualityDimension.EFFICIENCY in report.dimensions
         assert QualityDimension.STRUCTURE in report.dimensions
 
+    def test_lazy_package_export(self) -> None:
+        """Test quality classes are importable from the package root."""
+        import prompt_template
+
+        assert prompt_template.QualityScorer is QualityScorer
+        with pytest.raises(AttributeError):
+            _ = prompt_template.NotAnExport  # type: ignore[attr-defined]
+
     def test_dimension_weights_sum_to_one(self) -> None:
         """Test that dimension weights sum to 1.0."""
         total_weight = sum(QualityScorer.DIMENSION_WEIGHTS.values())
@@ -196,6 +208,15 @@ class TestQualityScorer:
         else:
             assert report.grade == "F"
 
+    def test_grade_table_boundaries(self) -> None:
+        """Test the precomputed grade table follows the thresholds."""
+        table = QualityScorer.GRADE_BY_SCORE
+
+        assert len(table) == 101
+        assert [table[s] for s in (0, 59, 60, 69, 70, 79, 80, 89, 90, 100)] == [
+            "F", "F", "D", "D", "C", "C", "B", "B", "A", "A",
+        ]
+
     def test_clarity_score_role_detection(self) -> None:
         """Test clarity score detects role definition."""
         scorer = QualityScorer()
@@ -308,6 +329,36 @@ class TestQualityScorer:
 
         assert short_efficiency > long_efficiency
 
+    def test_efficiency_uses_estimate_by_default(self) -> None:
+        """Test token counts are estimated unless the tokenizer is requested."""
+        content = "This is a very long template. " * 500
+        template = Template.from_dict({"name": "long", "template": content})
+
+        report = QualityScorer().score(template.config)
+        expected = TokenCounter(use_tiktoken=False).count_tokens(content)
+
+        details = report.dimensions[QualityDimension.EFFICIENCY].details
+        assert any(str(expected) in d for d in details)
+
+    def test_efficiency_score_repeated_variable(self) -> None:
+        """Test efficiency score flags variables used more than five times."""
+        scorer = QualityScorer()
+
+        template = Template.from_dict({
+            "name": "repeat",
+            "template": "{{ name }} " * 6 + "{{name_two}}",
+            "variables": [
+                {"name": "name", "type": "string"},
+                {"name": "name_two", "type": "string"},
+            ],
+        })
+
+        report = scorer.score(template.config)
+        details = report.dimensions[QualityDimension.EFFICIENCY].details
+
+        assert "Variable 'name' used 6 times" in details
+        assert not any("'name_two'" in d for d in details)
+
     def test_structure_score_split_prompts(self) -> None:
         """Test structure score prefers split prompts."""
         scorer = QualityScorer()
@@ -373,3 +424,101 @@ class TestQualityScorer:
             assert "below" in report.summary.lower()
         else:
             assert "poor" in report.summary.lower()
+
+    def test_top_suggestions_unique_and_limited(self) -> None:
+        """Test top suggestions are deduplicated and capped at five."""
+        scorer = QualityScorer()
+
+        template = Template.from_dict({
+            "name": "many-issues",
+            "template": "{{style}} {{format}} {{mode}} {{level}}",
+            "variables": [
+                {"name": "style", "type": "string"},
+                {"name": "format", "type": "string"},
+                {"name": "mode", "type": "string"},
+                {"name": "level", "type": "string"},
+            ],
+        })
+
+        report = scorer.score(template.config)
+
+        assert len(report.top_suggestions) == 5
+        assert len(set(report.top_suggestions)) == 5
+
+    def test_consistency_score_enum_types(self) -> None:
+        """Test consistency score flags mixed enum value types."""
+        scorer = QualityScorer()
+
+        def consistency(enum: list[object]) -> int:
+            template = Template.from_dict({
+                "name": "enum-check",
+                "template": "Mode: {{mode}}",
+                "variables": [{"name": "mode", "type": "string", "enum": enum}],
+            })
+            report = scorer.score(template.config)
+            return report.dimensions[QualityDimension.CONSISTENCY].score
+
+        assert consistency(["fast", "slow"]) > consistency(["fast", 2])
+
+    def test_repeated_score_uses_cache(self, monkeypatch) -> None:
+        """Test scoring an identical config again reuses the cached report."""
+        scorer = QualityScorer()
+        config = Template.from_dict({
+            "name": "cached",
+            "template": "You are a helper. Please summarize {{text}}.",
+            "variables": [{"name": "text", "type": "string"}],
+        }).config
+
+        first = scorer.score(config)
+
+        def fail(text: str) -> int:
+            raise AssertionError("template scored again")
+
+        monkeypatch.setattr(scorer.token_counter, "count_tokens", fail)
+        assert scorer.score(config) == first
+
+        scorer.cache_clear()
+        with pytest.raises(AssertionError):
+            scorer.score(config)
+
+    def test_report_is_immutable(self) -> None:
+        """Test edits to a returned report do not reach the cached one."""
+        scorer = QualityScorer()
+        config = Template.from_dict({"name": "frozen", "template": "Hi"}).config
+        report = scorer.score(config)
+
+        with pytest.raises(AttributeError):
+            report.overall_score = 100  # type: ignore[misc]
+        del report.dimensions[QualityDimension.CLARITY]
+        assert QualityDimension.CLARITY in scorer.score(config).dimensions
+
+    def test_report_round_trips(self) -> None:
+        """Test reports convert with asdict and survive pickling."""
+        config = Template.from_dict({"name": "pickled", "template": "Hi"}).config
+        report = QualityScorer().score(config)
+
+        data = asdict(report)
+        assert data["dimensions"][QualityDimension.CLARITY]["score"] == (
+            report.dimensions[QualityDimension.CLARITY].score
+        )
+        assert pickle.loads(pickle.dumps(report)) == report
+
+    def test_cache_sees_config_changes(self) -> None:
+        """Test a modified config is rescored rather than served from cache."""
+        scorer = QualityScorer()
+        config = Template.from_dict({
+            "name": "cached",
+            "template": "Summarize {{text}}.",
+            "variables": [{"name": "text", "type": "string"}],
+        }).config
+
+        before = scorer.score(config)
+        config.description = "Summarizes arbitrary text into a short paragraph"
+        after = scorer.score(config)
+
+        completeness = QualityDimension.COMPLETENESS
+        assert (
+            after.dimensions[completeness].score
+            > before.dimensions[completeness].score
+        )
+
@@ -1,27 +1,29 @@
 """Tests for the TemplateRegistry class."""
 
+import json
 import shutil
-import tempfile
 from pathlib import Path
 
 import pytest
 
 from prompt_template import TemplateNotFoundError, TemplateRegistry
+from prompt_template.registry import _close_matches
 
 
-class TestTemplateRegistry:
-    """Tests for template registry functionality."""
+@pytest.fixture(scope="module")
+def temp_templates_dir(tmp_path_factory):
+    """Create a temporary directory with test templates.
 
-    @pytest.fixture
-    def temp_templates_dir(self):
-        """Create a temporary directory with test templates."""
-        temp_dir = Path(tempfile.mkdtemp())
-
-        # Create some test templates
-        templates = [
-            {
-                "path": temp_dir / "greeting.yaml",
-                "content": """
+    Shared by every test in the module, so tests must not modify it;
+    use writable_templates_dir instead.
+    """
+    temp_dir = tmp_path_factory.mktemp("templates")
+
+    # Create some test templates
+    templates = [
+        {
+            "path": temp_dir / "greeting.yaml",
+            "content": """
 name: greeting
 description: A friendly greeting template
 version: 1.0.0
@@ -34,10 +36,10 @@ variables:
     type: string
     required: true
 """,
-            },
-            {
-                "path": temp_dir / "summarizer.yaml",
-                "content": """
+        },
+        {
+            "path": temp_dir / "summarizer.yaml",
+            "content": """
 name: summarizer
 description: Summarize text content
 version: 2.0.0
@@ -50,10 +52,10 @@ variables:
     type: string
     required: true
 """,
-            },
-            {
-                "path": temp_dir / "subdir" / "nested.yaml",
-                "content": """
+        },
+        {
+            "path": temp_dir / "subdir" / "nested.yaml",
+            "content": """
 name: nested-template
 description: A template in a subdirectory
 template: "Nested: {{value}}"
@@ -62,17 +64,23 @@ variables:
     type: string
     required: true
 """,
-            },
-        ]
+        },
+    ]
 
-        for t in templates:
-            t["path"].parent.mkdir(parents=True, exist_ok=True)
-            t["path"].write_text(t["content"])
+    for t in templates:
+        t["path"].parent.mkdir(parents=True, exist_ok=True)
+        t["path"].write_text(t["content"])
 
-        yield temp_dir
+    return temp_dir
 
-        # Cleanup
-        shutil.rmtree(temp_dir)
+
+class TestTemplateRegistry:
+    """Tests for template registry functionality."""
+
+    @pytest.fixture
+    def writable_templates_dir(self, temp_templates_dir, tmp_path):
+        """Create a private copy of the test templates that tests may modify."""
+        return shutil.copytree(temp_templates_dir, tmp_path / "templates")
 
     def test_list_templates(self, temp_templates_dir):
         """Test listing all templates."""
@@ -133,6 +141,25 @@ variables:
         assert error.suggestion is not None
         assert "greeting" in error.suggestion
 
+    def test_close_matches_orders_ties_like_difflib(self):
+        """Test equally similar suggestions are ordered as difflib orders them."""
+        from difflib import get_close_matches
+
+        names = ["abc", "abd"]
+
+        assert _close_matches("abx", names) == ["abd", "abc"]
+        assert _close_matches("abx", names) == get_close_matches(
+            "abx", names, n=3, cutoff=0.4
+        )
+
+    def test_close_matches_finds_typos(self):
+        """Test a misspelled name suggests the intended one first."""
+        names = ["greeting", "summarizer", "code-reviewer", "translator"]
+
+        assert _close_matches("greating", names)[0] == "greeting"
+        assert _close_matches("sumarize", names)[0] == "summarizer"
+        assert _close_matches("xyz", names) == []
+
     def test_search_by_query(self, temp_templates_dir):
         """Test searching templates by query."""
         registry = TemplateRegistry(search_paths=[temp_templates_dir])
@@ -159,6 +186,14 @@ variables:
         # Note: query searches name/description, not template content
         _ = registry.search(query="hello", tags=["simple"])
 
+    def test_search_requires_query_and_tag_match(self, temp_templates_dir):
+        """Test combined filters keep only templates matching both."""
+        registry = TemplateRegistry(search_paths=[temp_templates_dir])
+
+        results = registry.search(query="greet", tags=["SIMPLE", "other"])
+        assert [t.name for t in results] == ["greeting"]
+        assert registry.search(query="summar", tags=["simple"]) == []
+
     def test_exists(self, temp_templates_dir):
         """Test checking if template exists."""
         registry = TemplateRegistry(search_paths=[temp_templates_dir])
@@ -179,11 +214,10 @@ variables:
         # Now should find templates
         assert len(registry.list()) == 3
 
-    def test_search_paths_priority(self, temp_templates_dir):
+    def test_search_paths_priority(self, temp_templates_dir, tmp_path):
         """Test that earlier search paths take priority."""
         # Create another directory with same template name
-        temp_dir2 = Path(tempfile.mkdtemp())
-        (temp_dir2 / "greeting.yaml").write_text("""
+        (tmp_path / "greeting.yaml").write_text("""
 name: greeting
 description: Override greeting
 template: "Hi, {{name}}!"
@@ -193,14 +227,151 @@ variables:
     required: true
 """)
 
-        try:
-            # First path takes priority
-            registry = TemplateRegistry(search_paths=[temp_dir2, temp_templates_dir])
+        # First path takes priority
+        registry = TemplateRegistry(search_paths=[tmp_path, temp_templates_dir])
+
+        template = registry.load("greeting")
+        assert template.description == "Override greeting"
 
-            template = registry.load("greeting")
-            assert template.description == "Override greeting"
-        finally:
-            shutil.rmtree(temp_dir2)
+    def test_list_first_found_wins(self, temp_templates_dir, tmp_path):
+        """Test that list() keeps the template from the earliest search path."""
+        (tmp_path / "hello.yaml").write_text("""
+name: greeting
+description: Override greeting
+template: "Hi, {{name}}!"
+""")
+
+        registry = TemplateRegistry(search_paths=[tmp_path, temp_templates_dir])
+
+        templates = registry.list()
+        greeting = next(t for t in templates if t.name == "greeting")
+        assert greeting.description == "Override greeting"
+        assert len(templates) == 3
+
+    def test_load_reuses_parsed_config(self, temp_templates_dir, monkeypatch):
+        """Test files parsed during discovery are not parsed again on load."""
+        registry = TemplateRegistry(search_paths=[temp_templates_dir])
+        registry.list()
+
+        def fail(path):
+            raise AssertionError(f"{path} read again")
+
+        monkeypatch.setattr(Path, "read_bytes", fail)
+        template = registry.load("nested-template")
+        assert template.name == "nested-template"
+
+        # Loaded templates do not share state with the cache
+        template.config.description = "changed"
+        assert registry.load("nested-template").description != "changed"
+
+    def test_load_sees_modified_file(self, writable_templates_dir):
+        """Test cached configs are refreshed when the file changes."""
+        registry = TemplateRegistry(search_paths=[writable_templates_dir])
+        assert registry.load("greeting").description == "A friendly greeting template"
+
+        (writable_templates_dir / "greeting.yaml").write_text(
+            'name: greeting\ndescription: Updated\ntemplate: "Hi!"\n'
+        )
+        assert registry.load("greeting").description == "Updated"
+
+    def test_add_search_path_takes_priority_by_name(self, tmp_path):
+        """Test a newly added path wins a template-name lookup."""
+        first, second = tmp_path / "a", tmp_path / "b"
+        for directory, filename in ((first, "one.yaml"), (second, "two.yaml")):
+            directory.mkdir()
+            (directory / filename).write_text('name: shared\ntemplate: "Hi"\n')
+
+        registry = TemplateRegistry(search_paths=[first])
+        assert registry.find("shared") == first / "one.yaml"
+
+        registry.add_search_path(second)
+        assert registry.find("shared") == second / "two.yaml"
+
+    def test_find_by_name_sees_new_higher_priority_file(self, tmp_path):
+        """Test a file created after a lookup can shadow the earlier match."""
+        first, second = tmp_path / "a", tmp_path / "b"
+        first.mkdir()
+        second.mkdir()
+        (second / "two.yaml").write_text('name: shared\ntemplate: "Hi"\n')
+
+        registry = TemplateRegistry(search_paths=[first, second])
+        assert registry.find("shared") == second / "two.yaml"
+
+        (first / "one.yaml").write_text('name: shared\ntemplate: "Hi"\n')
+        assert registry.find("shared") == first / "one.yaml"
+
+    def test_find_by_name_sees_renamed_template(self, writable_templates_dir):
+        """Test a remembered path is dropped once its template is renamed."""
+        registry = TemplateRegistry(search_paths=[writable_templates_dir])
+        assert registry.exists("nested-template")
+
+        (writable_templates_dir / "subdir" / "nested.yaml").write_text(
+            'name: renamed-template\ntemplate: "Nested!"\n'
+        )
+        assert not registry.exists("nested-template")
+        assert registry.exists("renamed-template")
+
+    def test_index_reused_across_registries(
+        self, temp_templates_dir, tmp_path, monkeypatch
+    ):
+        """Test a persistent index lets new registries skip parsing."""
+        index_path = tmp_path / "index.json"
+        expected = TemplateRegistry(search_paths=[temp_templates_dir]).list()
+
+        search_paths = [temp_templates_dir]
+        TemplateRegistry(search_paths=search_paths, index_path=index_path).list()
+        assert index_path.exists()
+
+        read_bytes = Path.read_bytes
+
+        def fail(path):
+            if path == index_path:
+                return read_bytes(path)
+            raise AssertionError(f"{path} read again")
+
+        monkeypatch.setattr(Path, "read_bytes", fail)
+        monkeypatch.setenv("PROMPT_TEMPLATE_INDEX_CACHE", str(index_path))
+        assert TemplateRegistry(search_paths=[temp_templates_dir]).list() == expected
+
+    def test_index_written_when_find_stops_early(self, temp_templates_dir, tmp_path):
+        """Test entries parsed by a name lookup reach the persistent index."""
+        index_path = tmp_path / "index.json"
+        registry = TemplateRegistry(
+            search_paths=[temp_templates_dir], index_path=index_path
+        )
+
+        # Found by its declared name, so discovery is abandoned on the match
+        assert registry.find("nested-template") is not None
+        assert index_path.exists()
+
+    def test_find_stops_parsing_at_first_match(self, tmp_path, monkeypatch):
+        """Test a name lookup does not parse files queued after the match."""
+        monkeypatch.setattr(TemplateRegistry, "MAX_DISCOVERY_WORKERS", 2)
+        templates = tmp_path / "many"
+        templates.mkdir()
+        for i in range(500):
+            (templates / f"file{i}.yaml").write_text('name: shared\ntemplate: "Hi"\n')
+        index_path = tmp_path / "index.json"
+        registry = TemplateRegistry(search_paths=[templates], index_path=index_path)
+
+        assert registry.find("shared") is not None
+        entries = json.loads(index_path.read_text())["entries"]
+        assert 0 < len(entries) < 500
+
+    def test_index_sees_modified_file(self, writable_templates_dir, tmp_path):
+        """Test index entries are refreshed when the file changes."""
+        index_path = tmp_path / "index.json"
+        search_paths = [writable_templates_dir]
+        TemplateRegistry(search_paths=search_paths, index_path=index_path).list()
+
+        (writable_templates_dir / "greeting.yaml").write_text(
+            'name: greeting\ndescription: Updated\ntemplate: "Hi!"\n'
+        )
+        registry = TemplateRegistry(
+            search_paths=[writable_templates_dir], index_path=index_path
+        )
+        infos = {info.name: info for info in registry.list()}
+        assert infos["greeting"].description == "Updated"
 
     def test_get_search_paths_status(self, temp_templates_dir):
         """Test getting search paths status."""
@@ -1,12 +1,18 @@
 """Tests for semantic validation."""
 
 
+import dataclasses
+import re
+
+import pytest
+
 from prompt_template import Template
 from prompt_template.semantic import (
     SemanticIssue,
     SemanticIssueType,
     SemanticValidationResult,
     SemanticValidator,
+    _required_prefixes,
 )
 
 
@@ -51,6 +57,49 @@ class TestSemanticValidationResult:
         assert result.is_valid is False
         assert len(result.issues) == 1
 
+    def test_issues_are_immutable_and_hashable(self) -> None:
+        """Test issues are frozen, so duplicates collapse in a set."""
+        issue = SemanticIssue(
+            type=SemanticIssueType.ROLE_CONFUSION,
+            severity="info",
+            message="Test info",
+            location="template",
+        )
+
+        with pytest.raises(AttributeError):
+            issue.severity = "error"  # type: ignore[misc]
+        assert len({issue, dataclasses.replace(issue)}) == 1
+
+    def test_get_issues_by_type(self) -> None:
+        """Test issues can be looked up by type in insertion order."""
+        result = SemanticValidationResult()
+        issues = [
+            SemanticIssue(
+                type=issue_type,
+                severity="info",
+                message=f"Issue {i}",
+                location="template",
+            )
+            for i, issue_type in enumerate([
+                SemanticIssueType.ROLE_CONFUSION,
+                SemanticIssueType.TASK_ALIGNMENT,
+                SemanticIssueType.ROLE_CONFUSION,
+            ])
+        ]
+        for issue in issues:
+            result.add_issue(issue)
+
+        roles = result.get_issues(SemanticIssueType.ROLE_CONFUSION)
+        assert roles == [issues[0], issues[2]]
+        assert result.get_issues(SemanticIssueType.PROMPT_STRUCTURE) == []
+
+        # Results built with issues, or copied, group them the same way
+        for other in (
+            SemanticValidationResult(issues=list(issues)),
+            dataclasses.replace(result),
+        ):
+            assert other.get_issues(SemanticIssueType.ROLE_CONFUSION) == roles
+
     def test_to_validation_result(self) -> None:
         """Test conversion to ValidationResult."""
         result = SemanticValidationResult()
@@ -120,6 +169,19 @@ class TestSemanticValidator:
         result = validator.validate(template.config)
         assert result.role_clarity_score >= 80
 
+    def test_detect_role_definition_xml_tag_uppercase(self) -> None:
+        """Test <ROLE> tags are detected case-insensitively."""
+        validator = SemanticValidator()
+
+        template = Template.from_dict({
+            "name": "test",
+            "template": "<ROLE>Expert coder</ROLE>\nHelp with {{task}}.",
+            "variables": [{"name": "task", "type": "string"}],
+        })
+
+        result = validator.validate(template.config)
+        assert result.role_clarity_score >= 80
+
     def test_missing_role_definition(self) -> None:
         """Test warning for missing role definition."""
         validator = SemanticValidator()
@@ -290,6 +352,23 @@ class TestSemanticValidator:
         ]
         assert len(placeholder_issues) > 0
 
+    def test_placeholder_quality_with_context(self) -> None:
+        """Test placeholders with surrounding text are not flagged."""
+        validator = SemanticValidator()
+
+        template = Template.from_dict({
+            "name": "test",
+            "template": "Code to review:\n{{code}}\n\n" + "x" * 40 + "\n\n{{ code }}",
+            "variables": [{"name": "code", "type": "string"}],
+        })
+
+        result = validator.validate(template.config)
+
+        placeholder_issues = [
+            i for i in result.issues if i.type == SemanticIssueType.PLACEHOLDER_QUALITY
+        ]
+        assert placeholder_issues == []
+
     def test_good_template_high_scores(self) -> None:
         """Test that a well-structured template gets high scores."""
         validator = SemanticValidator()
@@ -330,3 +409,89 @@ class TestSemanticValidator:
         assert result.instruction_clarity_score >= 60
         assert result.context_coherence_score >= 80
         assert result.task_alignment_score >= 80
+
+    def test_compiled_patterns_shared(self, monkeypatch) -> None:
+        """Test new validators reuse the compiled pattern matchers."""
+        config = Template.from_dict({"name": "t", "template": "Review {{x}}."}).config
+        expected = SemanticValidator().validate(config)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("patterns compiled again")
+
+        monkeypatch.setattr(re, "compile", fail)
+        assert SemanticValidator().validate(config) == expected
+
+    def test_validate_many_matches_validate(self) -> None:
+        """Test batch validation returns the per-template results in order."""
+        validator = SemanticValidator()
+        configs = [
+            Template.from_dict({"name": "a", "template": "Hello, {{name}}!"}).config,
+            Template.from_dict({
+                "name": "b",
+                "system_prompt": "You are a reviewer.",
+                "user_prompt": "Please review {{code}}.",
+            }).config,
+        ]
+
+        results = validator.validate_many(iter(configs))
+
+        assert results == [validator.validate(config) for config in configs]
+
+    @pytest.mark.parametrize(
+        ("patterns", "expected"),
+        [
+            ((r"you are\s+(a|an)", r"\bmaybe\b"), ("you are", "maybe")),
+            ((r"colou?r",), ("colo",)),
+            ((r"<ROLE>",), ("<role>",)),
+            ((r"cat|dog",), None),
+            ((r"(a|an) expert",), None),
+            ((r"[ab]c",), None),
+        ],
+    )
+    def test_required_prefixes(self, patterns, expected) -> None:
+        """Test prefilter prefixes are only derived when every match needs one."""
+        assert _required_prefixes(patterns) == expected
+
+    @pytest.mark.parametrize(
+        ("source", "has_role"),
+        [
+            ("YOU ARE A critic. Review {{x}}.", True),
+            ("you are a critic. Review {{x}}.", True),
+            ("Review {{x}}.", False),
+        ],
+    )
+    def test_prefilter_keeps_role_detection(self, source, has_role) -> None:
+        """Test the prefix prefilter neither adds nor loses role matches."""
+        config = Template.from_dict({"name": "t", "template": source}).config
+        result = SemanticValidator().validate(config)
+
+        roles = result.get_issues(SemanticIssueType.ROLE_CONFUSION)
+        assert any("No clear role" in i.message for i in roles) is not has_role
+
+
+class TestHyperscanBackend:
+    """Tests for the optional hyperscan matching backend."""
+
+    def test_hyperscan_matches_re_backend(self) -> None:
+        """Test hyperscan and re backends produce the same results."""
+        pytest.importorskip("hyperscan")
+
+        template = Template.from_dict({
+            "name": "test",
+            "description": "Reviews code for bugs",
+            "system_prompt": "As a reviewer, you check code. <ROLE>x</ROLE>",
+            "user_prompt": "Please review {{code}}. Format your response as a list.",
+            "variables": [{"name": "code", "type": "string"}],
+        })
+
+        hs_result = SemanticValidator(use_hyperscan=True).validate(template.config)
+        re_result = SemanticValidator(use_hyperscan=False).validate(template.config)
+
+        assert hs_result.role_clarity_score == re_result.role_clarity_score
+        assert (
+            hs_result.instruction_clarity_score
+            == re_result.instruction_clarity_score
+        )
+        assert [i.message for i in hs_result.issues] == [
+            i.message for i in re_result.issues
+        ]
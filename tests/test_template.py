@@ -1,13 +1,17 @@
 """Tests for the Template class."""
 
-import tempfile
+import subprocess
+import sys
 
 import pytest
+from jinja2 import TemplateSyntaxError
+from jinja2.sandbox import SandboxedEnvironment
 
 from prompt_template import (
     Template,
     TemplateConfig,
     TemplateNotFoundError,
+    TemplateRenderer,
     TemplateRenderError,
     TemplateValidationError,
     VariableConfig,
@@ -15,6 +19,11 @@ from prompt_template import (
 )
 
 
+def _fail(*args, **kwargs):
+    """Stand in for a call a test expects not to happen."""
+    raise AssertionError("unexpected call")
+
+
 class TestTemplateCreation:
     """Tests for template creation."""
 
@@ -60,18 +69,77 @@ variables:
         assert template.name == "my-template"
         assert template.description == "A test template"
 
-    def test_create_from_file(self):
+    def test_from_string_reuses_parsed_config(self, monkeypatch):
+        """Test repeated loads of the same content skip YAML parsing."""
+        yaml_content = 'name: cached-template\ntemplate: "Hi, {{name}}!"\n'
+        first = Template.from_string(yaml_content)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("content parsed again")
+
+        monkeypatch.setattr("yaml.load", fail)
+        second = Template.from_string(yaml_content)
+        assert second.name == "cached-template"
+
+        # Templates do not share their config with the cache or each other
+        first.config.description = "changed"
+        assert Template.from_string(yaml_content).description != "changed"
+
+    def test_create_from_file(self, tmp_path):
         """Test creating template from file."""
-        yaml_content = """
+        path = tmp_path / "file-template.yaml"
+        path.write_text("""
 name: file-template
 template: "Hello from file!"
-"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
+""")
+
+        template = Template.from_file(str(path))
+        assert template.name == "file-template"
+
+    def test_create_from_file_utf8(self, tmp_path):
+        """Test non-ASCII template files are decoded as UTF-8."""
+        path = tmp_path / "unicode.yaml"
+        path.write_bytes('name: unicode\ntemplate: "Héllo, {{name}} ✓"\n'.encode())
+
+        template = Template.from_file(path)
+        assert template.template_content == "Héllo, {{name}} ✓"
 
-            template = Template.from_file(f.name)
-            assert template.name == "file-template"
+    def test_create_from_json_file(self, tmp_path):
+        """Test JSON template files are loaded."""
+        path = tmp_path / "greeting.json"
+        path.write_text('{"name": "greeting", "template": "Hello, {{name}}!"}')
+
+        template = Template.from_file(path)
+        assert template.name == "greeting"
+        assert template.render(name="JSON") == "Hello, JSON!"
+
+    def test_package_import_defers_yaml(self):
+        """Test PyYAML is only imported once YAML content is loaded."""
+        code = (
+            "import sys, prompt_template as pt\n"
+            "assert 'yaml' not in sys.modules\n"
+            "pt.Template.from_dict({'name': 'a', 'template': 'x'})\n"
+            "assert 'yaml' not in sys.modules\n"
+            "pt.Template.from_string('name: a\\ntemplate: x')\n"
+            "assert 'yaml' in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_invalid_json_file_error(self, tmp_path):
+        """Test error for malformed JSON template files."""
+        path = tmp_path / "broken.json"
+        path.write_text('{"name": "broken",}')
+
+        with pytest.raises(TemplateValidationError):
+            Template.from_file(path)
+
+    def test_invalid_encoding_error(self, tmp_path):
+        """Test error for template files that are not valid UTF-8."""
+        path = tmp_path / "latin1.yaml"
+        path.write_bytes(b"name: bad\ntemplate: \"caf\xe9\"\n")
+
+        with pytest.raises(TemplateValidationError):
+            Template.from_file(path)
 
     def test_file_not_found_error(self):
         """Test error when file doesn't exist."""
@@ -107,6 +175,48 @@ class TestTemplateRendering:
         result = template.render(name="World")
         assert result == "Hello, World!"
 
+    def test_render_reuses_compiled_template(self, monkeypatch):
+        """Test repeated renders reuse the template's compiled Jinja2 object."""
+        template = Template.from_dict({
+            "name": "greeting",
+            "template": "Hello, {{name|upper}}!",
+            "variables": [{"name": "name", "type": "string", "required": True}],
+        })
+
+        assert template.render(name="a") == "Hello, A!"
+        monkeypatch.setattr(TemplateRenderer, "compile", _fail)
+        assert template.render(name="b") == "Hello, B!"
+
+    def test_simple_render_skips_jinja(self, monkeypatch):
+        """Test plain {{ name }} templates render without compiling Jinja2."""
+        template = Template.from_dict({
+            "name": "greeting",
+            "template": "{Hi} {{ name }}!\r\n{{age}}\n",
+            "variables": [
+                {"name": "name", "type": "string", "required": True},
+                {"name": "age", "type": "integer", "default": 3},
+            ],
+        })
+
+        monkeypatch.setattr(TemplateRenderer, "compile", _fail)
+        assert template.render(name="{x}") == "{Hi} {x}!\n3"
+
+    @pytest.mark.parametrize(
+        "source", ["JSON: {{{ name }}}", "{{{name}}", "{{name}}}", "{ {{name}} }"]
+    )
+    def test_brace_adjacent_render_matches_jinja(self, source):
+        """Test braces touching a placeholder render as Jinja2 renders them."""
+        renderer = TemplateRenderer()
+        template = Template.from_dict({"name": "braces", "template": source})
+
+        try:
+            expected = renderer.env.from_string(source).render(name="x")
+        except TemplateSyntaxError:
+            with pytest.raises(TemplateRenderError):
+                template.render(name="x")
+        else:
+            assert template.render(name="x") == expected
+
     def test_render_with_defaults(self):
         """Test rendering with default values."""
         template = Template.from_dict({
@@ -237,6 +347,30 @@ class TestTemplateValidation:
         assert not result.is_valid
         assert len(result.errors) > 0
 
+    def test_duplicate_variable_names(self):
+        """Test each repeated variable definition is reported."""
+        template = Template.from_dict({
+            "name": "dupes",
+            "template": "{{a}} {{b}}",
+            "variables": [{"name": "a"}, {"name": "b"}, {"name": "a"}],
+        })
+
+        result = template.validate()
+        assert result.errors == ["Duplicate variable name: 'a'"]
+
+    def test_fast_fail_stops_after_syntax_errors(self):
+        """Test fast_fail skips later passes once an error is found."""
+        template = Template.from_dict({
+            "name": "invalid-syntax",
+            "template": "Hello, {{name}!",
+            "variables": [{"name": "unused", "type": "string"}],
+        })
+
+        result = template.validate(fast_fail=True)
+        assert not result.is_valid
+        assert result.warnings == []
+        assert template.validate().warnings
+
     def test_unused_variable_warning(self):
         """Test warning for unused variables."""
         template = Template.from_dict({
@@ -284,6 +418,207 @@ class TestTemplateValidation:
         with pytest.raises(TemplateRenderError):
             template.render(style="invalid")
 
+    def test_validate_inputs_reports_every_issue(self):
+        """Test input validation reports each type, enum and missing issue."""
+        from prompt_template.validator import TemplateValidator
+
+        template = Template.from_dict({
+            "name": "checker",
+            "template": "{{a}} {{b}} {{c}}",
+            "variables": [
+                {"name": "a", "type": "integer", "required": True},
+                {"name": "b", "type": "string", "enum": ["x", "y"]},
+                {"name": "c", "type": "boolean", "required": True},
+            ],
+        })
+        result = TemplateValidator().validate_inputs(
+            template.config, {"a": True, "b": "z", "extra": 1}
+        )
+
+        assert len(result.errors) == 3
+        assert result.warnings == ["Unknown variable provided: 'extra'"]
+
+    def test_render_checks_edited_variables(self):
+        """Test render validates against variables edited after construction."""
+        template = Template.from_dict({
+            "name": "edited",
+            "template": "{{count}}",
+            "variables": [{"name": "count", "type": "string"}],
+        })
+        assert template.render(count="3") == "3"
+
+        template.config.variables[0].type = VariableType.INTEGER
+        with pytest.raises(TemplateRenderError):
+            template.render(count="3")
+
+    def test_render_uses_default_set_after_construction(self):
+        """Test render fills in defaults added after construction."""
+        template = Template.from_dict({
+            "name": "late-default",
+            "template": "Hi {{a}} {{b}}",
+            "variables": [
+                {"name": "a", "required": True},
+                {"name": "b", "required": True},
+            ],
+        })
+        template.config.variables[1].default = "X"
+        assert template.render(a="A") == "Hi A X"
+
+    def test_enum_validation_unhashable_values(self):
+        """Test enum checks handle unhashable enum and input values."""
+        template = Template.from_dict({
+            "name": "enum-lists",
+            "template": "{{pair}} {{style}}",
+            "variables": [
+                {"name": "pair", "type": "list", "enum": [[1, 2], [3, 4]]},
+                {"name": "style", "type": "string", "enum": ["a", "b"]},
+            ],
+        })
+
+        assert template.render(pair=[3, 4], style="a") == "[3, 4] a"
+        with pytest.raises(TemplateRenderError):
+            template.render(pair=[5, 6], style="a")
+        with pytest.raises(TemplateRenderError):
+            template.render(pair=[1, 2], style=["a"])
+
+
+class TestTemplateRenderer:
+    """Tests for the Jinja2 renderer."""
+
+    def test_compiled_template_cached(self):
+        """Test repeated renders reuse the compiled template."""
+        renderer = TemplateRenderer()
+
+        assert renderer.render("Hi {{name}}", {"name": "A"}) == "Hi A"
+        compiled = renderer.compile("Hi {{name}}")
+        assert renderer.render("Hi {{name}}", {"name": "B"}) == "Hi B"
+        assert renderer.compile("Hi {{name}}") is compiled
+
+    def test_templates_share_renderer(self, monkeypatch):
+        """Test templates reuse one renderer and its compile cache."""
+        first = Template.from_dict({"name": "a", "template": "Hi {{name|upper}}"})
+        second = Template.from_dict({"name": "b", "template": "Hi {{name|upper}}"})
+
+        assert first.render(name="a") == "Hi A"
+        # The second template finds the first one's compiled source
+        monkeypatch.setattr(SandboxedEnvironment, "from_string", _fail)
+        monkeypatch.setattr(SandboxedEnvironment, "get_template", _fail)
+        assert second.render(name="b") == "Hi B"
+
+    def test_compiled_cache_evicts_oldest(self, monkeypatch):
+        """Test the compile cache is bounded."""
+        monkeypatch.setattr(TemplateRenderer, "CACHE_SIZE", 2)
+        renderer = TemplateRenderer()
+
+        a, b, c = (renderer.compile(s) for s in ("a {{x}}", "b {{x}}", "c {{x}}"))
+
+        assert renderer.compile("c {{x}}") is c
+        assert renderer.compile("b {{x}}") is b
+        assert renderer.compile("a {{x}}") is not a
+
+    def test_extract_variables_cached_copy(self):
+        """Test cached variable sets are not shared with callers."""
+        renderer = TemplateRenderer()
+
+        first = renderer.extract_variables("{{a}} {{b}}")
+        first.add("mutated")
+
+        assert renderer.extract_variables("{{a}} {{b}}") == {"a", "b"}
+
+    def test_plain_text_skips_parse(self, monkeypatch):
+        """Test strings without Jinja2 markup are not parsed."""
+        renderer = TemplateRenderer()
+        assert renderer.validate_syntax("{# open comment")
+
+        monkeypatch.setattr(renderer.env, "parse", _fail)
+        assert renderer.extract_variables("Just text }}") == set()
+        errors = renderer.validate_syntax("Just text }}")
+        assert any("Unbalanced braces" in e for e in errors)
+
+    @pytest.mark.parametrize(
+        ("source", "expected", "parsed"),
+        [
+            ("{{a}} {{ b }} {{a}}", {"a", "b"}, False),
+            ("{{ true }} {{ range }} {{x}}", {"x"}, True),
+            ("{{ a.b }} {{ c|upper }}", {"a", "c"}, True),
+            ("{% if x %}{{ y }}{% endif %}", {"x", "y"}, True),
+        ],
+    )
+    def test_simple_variables_skip_parse(self, source, expected, parsed, monkeypatch):
+        """Test templates of bare {{ name }} expressions are not parsed."""
+        renderer = TemplateRenderer()
+        parse = renderer.env.parse
+        calls = []
+
+        def spy(source):
+            calls.append(source)
+            return parse(source)
+
+        monkeypatch.setattr(renderer.env, "parse", spy)
+        assert renderer.extract_variables(source) == expected
+        assert bool(calls) is parsed
+
+    def test_bytecode_cache_dir(self, tmp_path):
+        """Test compiled templates are written to the bytecode cache."""
+        renderer = TemplateRenderer(cache_dir=tmp_path)
+        assert renderer.render("Hi {{name}}", {"name": "A"}) == "Hi A"
+        assert list(tmp_path.iterdir())
+
+        # A fresh renderer loads the cached bytecode
+        fresh = TemplateRenderer(cache_dir=tmp_path)
+        assert fresh.render("Hi {{name}}", {"name": "B"}) == "Hi B"
+
+    def test_bytecode_cache_from_env(self, tmp_path, monkeypatch):
+        """Test the bytecode cache directory can be set via environment."""
+        monkeypatch.setenv("PROMPT_TEMPLATE_BYTECODE_CACHE", str(tmp_path))
+        renderer = TemplateRenderer()
+
+        assert renderer.env.bytecode_cache is not None
+        renderer.render("{{x}}", {"x": 1})
+        assert list(tmp_path.iterdir())
+
+    def test_shared_renderer_concurrent_renders(self, monkeypatch):
+        """Test threads rendering different templates through one renderer."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        # A tiny cache keeps threads evicting entries others are reading
+        monkeypatch.setattr(TemplateRenderer, "CACHE_SIZE", 4)
+        renderer = TemplateRenderer()
+        sources = [
+            "{% if x is defined %}{{ x }}-" + str(n) + "{% endif %}" for n in range(40)
+        ]
+
+        def render(n: int) -> str:
+            renderer.extract_variables(sources[n % 40])
+            return renderer.render(sources[n % 40], {"x": n % 40})
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(render, range(800)))
+        assert results == [f"{n % 40}-{n % 40}" for n in range(800)]
+
+    def test_bytecode_cache_dir_unusable(self, tmp_path, monkeypatch):
+        """Test an unusable cache directory leaves templates working uncached."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        monkeypatch.setenv("PROMPT_TEMPLATE_BYTECODE_CACHE", str(blocker / "cache"))
+        renderer = TemplateRenderer()
+
+        assert renderer.env.bytecode_cache is None
+        assert renderer.render("Hi {{name}}", {"name": "A"}) == "Hi A"
+
+    def test_bytecode_cache_concurrent_compiles(self, tmp_path):
+        """Test threads compiling the same new template all succeed."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        renderer = TemplateRenderer(cache_dir=tmp_path)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for n in range(50):
+                source = "{% for i in items %}{{ i }}" + str(n) + "{% endfor %}"
+                results = executor.map(
+                    lambda _: renderer.render(source, {"items": [1]}), range(8)
+                )
+                assert set(results) == {f"1{n}"}
+
 
 class TestTemplatePreview:
     """Tests for template preview functionality."""
@@ -318,6 +653,38 @@ class TestTemplatePreview:
         assert "Alice" in preview
         assert "[age]" in preview
 
+    @pytest.mark.parametrize(
+        ("source", "variables"),
+        [
+            ("Hi {{ name }}!\r\nAge: {{age}}\n", {"age": None}),
+            ("{{a}}{{b}} }}", {"a": "{{b}}", "b": [1, 2]}),
+            ("Just text\n\n", {}),
+        ],
+    )
+    def test_simple_preview_matches_jinja(self, source, variables, monkeypatch):
+        """Test substituted previews match Jinja2 rendering."""
+        expected = (
+            SandboxedEnvironment()
+            .from_string(source)
+            .render(**{"name": "[name]", "age": "[age]", **variables})
+        )
+
+        monkeypatch.setattr(SandboxedEnvironment, "from_string", _fail)
+        assert TemplateRenderer().preview(source, variables) == expected
+
+    @pytest.mark.parametrize(
+        ("source", "expected"),
+        [
+            ("JSON: {{{ name }}}", "Preview error (syntax): expected token ':'"),
+            ("{{name}}}", "x}"),
+        ],
+    )
+    def test_brace_adjacent_preview_matches_jinja(self, source, expected):
+        """Test braces touching a placeholder preview as Jinja2 renders them."""
+        renderer = TemplateRenderer()
+
+        assert renderer.preview(source, {"name": "x"}).startswith(expected)
+
 
 class TestTemplateHelpers:
     """Tests for template helper methods."""
@@ -339,6 +706,22 @@ class TestTemplateHelpers:
         assert "b" not in required  # Has default
         assert "c" in required
 
+    def test_get_variables_by_name(self):
+        """Test the name index keeps the first definition of a name."""
+        config = TemplateConfig(
+            name="test",
+            template="{{a}}",
+            variables=[
+                VariableConfig(name="a", description="first"),
+                VariableConfig(name="b"),
+                VariableConfig(name="a", description="second"),
+            ],
+        )
+
+        index = config.get_variables_by_name()
+        assert list(index) == ["a", "b"]
+        assert index["a"] is config.get_variable("a")
+
     def test_get_all_variables(self):
         """Test getting all variables from template."""
         template = Template.from_dict({